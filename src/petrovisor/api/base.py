@@ -6,10 +6,14 @@ from typing import (
     Dict,
 )
 
+import time
+import copy
+import threading
 import requests
+from concurrent.futures import Future
 
 from petrovisor.api.utils.login import ApiLogin
-from petrovisor.api.utils.requests import ApiRequests
+from petrovisor.api.utils.requests import ApiRequests, ApiEtagCache
 from petrovisor.api.utils.helper import ApiHelper
 
 from petrovisor.api.methods.items import ItemsMixinHelper
@@ -114,6 +118,8 @@ class RequestsMixin(SupportsRequests):
         username: Optional[str] = "",
         password: Optional[str] = "",
         errors: Optional[str] = "coerce",
+        cache_ttl: Optional[float] = None,
+        etag_cache_size: int = 0,
         **kwargs,
     ):
         """
@@ -137,6 +143,14 @@ class RequestsMixin(SupportsRequests):
             If ‘raise’, then invalid request will raise an exception.
             If ‘coerce’, then invalid request will issue a warning and return None.
             If ‘ignore’, then invalid request will return the response.
+        cache_ttl : float, default None
+            Time in seconds during which responses requested with 'get_cached', e.g. item and file names,
+            are reused. Cache is cleared by any 'POST', 'PUT' or 'DELETE' request.
+            If None, then responses are not cached.
+        etag_cache_size : int, default 0
+            Maximum number of responses, e.g. item listings, cached together with their ETag (entity tag).
+            Cached responses are revalidated with conditional requests, so that unchanged responses
+            are not downloaded again. If 0, then ETags are not used.
         """
         # workspace
         self.__workspace = workspace
@@ -212,6 +226,19 @@ class RequestsMixin(SupportsRequests):
         error_handling_types = ["raise", "coerce", "ignore"]
         self.__errors = errors if errors in error_handling_types else "coerce"
 
+        # cached responses
+        self.__cache_ttl = cache_ttl
+        self.__cache = {}
+        self.__etag_cache = ApiEtagCache(etag_cache_size) if etag_cache_size else None
+
+        # session keeping connections to the server alive, and token refresh lock
+        self.__session = ApiRequests.get_session()
+        self.__token_lock = threading.Lock()
+
+        # requests in flight, shared by concurrent identical requests
+        self.__inflight = {}
+        self.__inflight_lock = threading.Lock()
+
         super().__init__(**kwargs)
 
     # 'GET' request
@@ -223,6 +250,7 @@ class RequestsMixin(SupportsRequests):
         files: Optional[Any] = None,
         format: Optional[str] = "json",
         errors: Optional[str] = None,
+        use_etag: bool = False,
         **kwargs,
     ) -> Any:
         """
@@ -245,7 +273,13 @@ class RequestsMixin(SupportsRequests):
             If ‘coerce’, then invalid request will issue a warning and return None.
             If ‘ignore’, then invalid request will return the response.
             If None, then the 'errors' parameter defined in api session constructor is used.
+        use_etag : bool, default False
+            Whether to revalidate response cached together with its ETag,
+            if 'etag_cache_size' is defined in api session constructor
         """
+        etag_cache = self.__etag_cache if use_etag else None
+        # token used by request, so that it is refreshed only once if it has expired
+        token = self.Token
         response = ApiRequests.get(
             self.Api,
             rqst,
@@ -255,10 +289,12 @@ class RequestsMixin(SupportsRequests):
             files=files,
             format=format,
             route=self.Route,
-            token=self.Token,
+            token=token,
             refresh_token=self.RefreshToken,
             key=self.Key,
             discovery_url=self.DiscoveryUrl,
+            session=self.__session,
+            etag_cache=etag_cache,
             errors=errors or self.__errors,
             **kwargs,
         )
@@ -266,7 +302,7 @@ class RequestsMixin(SupportsRequests):
             ApiHelper.has_field(response, "status_code")
             and response.status_code == requests.codes.unauthorized
         ):
-            self.__reset_token(**kwargs)
+            self.__reset_token(token, **kwargs)
             response = ApiRequests.get(
                 self.Api,
                 rqst,
@@ -280,11 +316,93 @@ class RequestsMixin(SupportsRequests):
                 refresh_token=self.RefreshToken,
                 key=self.Key,
                 discovery_url=self.DiscoveryUrl,
+                session=self.__session,
+                etag_cache=etag_cache,
                 errors=errors or self.__errors,
                 **kwargs,
             )
         return response
 
+    # 'GET' request sharing response with concurrent identical requests
+    def get_shared(self, rqst: str, **kwargs) -> Any:
+        """
+        Get request. Identical requests issued concurrently, e.g. from several threads,
+        are sent once and share the response (a copy of it is returned to each caller)
+
+        Parameters
+        ----------
+        rqst : str
+            Request
+        """
+        try:
+            key = (rqst, frozenset(kwargs.items()))
+            hash(key)
+        except TypeError:
+            return self.get(rqst, **kwargs)
+        with self.__inflight_lock:
+            inflight = self.__inflight.get(key)
+            if inflight is None:
+                self.__inflight[key] = inflight = [Future(), 0]
+                is_sender = True
+            else:
+                inflight[1] += 1
+                is_sender = False
+        # wait for response of identical request in flight
+        if not is_sender:
+            return copy.deepcopy(inflight[0].result())
+        # send request, and share its response with waiting requests
+        future = inflight[0]
+        try:
+            response = self.get(rqst, **kwargs)
+        except BaseException as err:
+            with self.__inflight_lock:
+                self.__inflight.pop(key, None)
+            future.set_exception(err)
+            raise
+        with self.__inflight_lock:
+            self.__inflight.pop(key, None)
+            num_waiting = inflight[1]
+        if num_waiting:
+            future.set_result(copy.deepcopy(response))
+        return response
+
+    # 'GET' request reusing cached response
+    def get_cached(self, rqst: str, **kwargs) -> Any:
+        """
+        Get request, reusing response for the same request during 'cache_ttl' seconds.
+        If 'cache_ttl' is not defined, then it is the same as 'get'
+
+        Parameters
+        ----------
+        rqst : str
+            Request
+        """
+        if self.__cache_ttl is None:
+            return self.get_shared(rqst, **kwargs)
+        try:
+            key = (rqst, frozenset(kwargs.items()))
+            hash(key)
+        except TypeError:
+            return self.get(rqst, **kwargs)
+        cached = self.__cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.__cache_ttl:
+            response = cached[1]
+        else:
+            response = self.get_shared(rqst, **kwargs)
+            if response is not None:
+                self.__cache[key] = (time.monotonic(), response)
+        # copy of list is returned, so that cached response is not modified by caller
+        return list(response) if isinstance(response, list) else response
+
+    # clear cached responses
+    def clear_cache(self) -> None:
+        """
+        Clear responses cached by 'get_cached', and responses cached together with their ETag
+        """
+        self.__cache.clear()
+        if self.__etag_cache is not None:
+            self.__etag_cache.clear()
+
     # 'POST' request
     def post(
         self,
@@ -317,6 +435,11 @@ class RequestsMixin(SupportsRequests):
             If ‘ignore’, then invalid request will return the response.
             If None, then the 'errors' parameter defined in api session constructor is used.
         """
+        # data might be changed, so cached responses are discarded
+        # (responses cached together with their ETag are revalidated anyway)
+        self.__cache.clear()
+        # token used by request, so that it is refreshed only once if it has expired
+        token = self.Token
         response = ApiRequests.post(
             self.Api,
             rqst,
@@ -326,10 +449,11 @@ class RequestsMixin(SupportsRequests):
             files=files,
             format=format,
             route=self.Route,
-            token=self.Token,
+            token=token,
             refresh_token=self.RefreshToken,
             key=self.Key,
             discovery_url=self.DiscoveryUrl,
+            session=self.__session,
             errors=errors or self.__errors,
             **kwargs,
         )
@@ -337,7 +461,7 @@ class RequestsMixin(SupportsRequests):
             ApiHelper.has_field(response, "status_code")
             and response.status_code == requests.codes.unauthorized
         ):
-            self.__reset_token(**kwargs)
+            self.__reset_token(token, **kwargs)
             response = ApiRequests.post(
                 self.Api,
                 rqst,
@@ -351,6 +475,7 @@ class RequestsMixin(SupportsRequests):
                 refresh_token=self.RefreshToken,
                 key=self.Key,
                 discovery_url=self.DiscoveryUrl,
+                session=self.__session,
                 errors=errors or self.__errors,
                 **kwargs,
             )
@@ -388,6 +513,11 @@ class RequestsMixin(SupportsRequests):
             If ‘ignore’, then invalid request will return the response.
             If None, then the 'errors' parameter defined in api session constructor is used.
         """
+        # data might be changed, so cached responses are discarded
+        # (responses cached together with their ETag are revalidated anyway)
+        self.__cache.clear()
+        # token used by request, so that it is refreshed only once if it has expired
+        token = self.Token
         response = ApiRequests.put(
             self.Api,
             rqst,
@@ -397,10 +527,11 @@ class RequestsMixin(SupportsRequests):
             files=files,
             format=format,
             route=self.Route,
-            token=self.Token,
+            token=token,
             refresh_token=self.RefreshToken,
             key=self.Key,
             discovery_url=self.DiscoveryUrl,
+            session=self.__session,
             errors=errors or self.__errors,
             **kwargs,
         )
@@ -408,7 +539,7 @@ class RequestsMixin(SupportsRequests):
             ApiHelper.has_field(response, "status_code")
             and response.status_code == requests.codes.unauthorized
         ):
-            self.__reset_token(**kwargs)
+            self.__reset_token(token, **kwargs)
             response = ApiRequests.put(
                 self.Api,
                 rqst,
@@ -422,6 +553,7 @@ class RequestsMixin(SupportsRequests):
                 refresh_token=self.RefreshToken,
                 key=self.Key,
                 discovery_url=self.DiscoveryUrl,
+                session=self.__session,
                 errors=errors or self.__errors,
                 **kwargs,
             )
@@ -459,6 +591,11 @@ class RequestsMixin(SupportsRequests):
             If ‘ignore’, then invalid request will return the response.
             If None, then the 'errors' parameter defined in api session constructor is used.
         """
+        # data might be changed, so cached responses are discarded
+        # (responses cached together with their ETag are revalidated anyway)
+        self.__cache.clear()
+        # token used by request, so that it is refreshed only once if it has expired
+        token = self.Token
         response = ApiRequests.delete(
             self.Api,
             rqst,
@@ -468,10 +605,11 @@ class RequestsMixin(SupportsRequests):
             files=files,
             format=format,
             route=self.Route,
-            token=self.Token,
+            token=token,
             refresh_token=self.RefreshToken,
             key=self.Key,
             discovery_url=self.DiscoveryUrl,
+            session=self.__session,
             errors=errors or self.__errors,
             **kwargs,
         )
@@ -479,7 +617,7 @@ class RequestsMixin(SupportsRequests):
             ApiHelper.has_field(response, "status_code")
             and response.status_code == requests.codes.unauthorized
         ):
-            self.__reset_token(**kwargs)
+            self.__reset_token(token, **kwargs)
             response = ApiRequests.delete(
                 self.Api,
                 rqst,
@@ -493,6 +631,7 @@ class RequestsMixin(SupportsRequests):
                 refresh_token=self.RefreshToken,
                 key=self.Key,
                 discovery_url=self.DiscoveryUrl,
+                session=self.__session,
                 errors=errors or self.__errors,
                 **kwargs,
             )
@@ -601,15 +740,23 @@ class RequestsMixin(SupportsRequests):
         return ApiHelper.remove_from_dict(d, keys, **kwargs)
 
     # reset token
-    def __reset_token(self, **kwargs) -> Any:
+    def __reset_token(self, token: str = "", **kwargs) -> Any:
         """
         Reset token
-        """
-        access_response = ApiLogin.get_access_token(
-            key=self.Key, discovery_url=self.DiscoveryUrl, **kwargs
-        )
-        self.__access_token = (
-            access_response["access_token"]
-            if ("access_token" in access_response)
-            else ""
-        )
+
+        Parameters
+        ----------
+        token : str, default ''
+            Expired token. If token was already reset by another request, then it is not reset again
+        """
+        with self.__token_lock:
+            if token and token != self.__access_token:
+                return
+            access_response = ApiLogin.get_access_token(
+                key=self.Key, discovery_url=self.DiscoveryUrl, **kwargs
+            )
+            self.__access_token = (
+                access_response["access_token"]
+                if ("access_token" in access_response)
+                else ""
+            )
@@ -369,9 +369,9 @@ class ContextMixin(
                         self.get_entity(ApiHelper.get_object_name(entities))
                     ]
                 else:
-                    eset_entities = [
-                        self.get_entity(ApiHelper.get_object_name(e)) for e in entities
-                    ]
+                    eset_entities = self.get_entities_by_names(
+                        [ApiHelper.get_object_name(e) for e in entities]
+                    )
             else:
                 eset_entities = []
             if entity_type is not None:
@@ -6,15 +6,25 @@ from typing import (
     Dict,
     Tuple,
     Iterable,
+    Iterator,
+    Callable,
 )
 
 import io
 import re
-import copy
+import importlib.util
 from datetime import datetime
+from functools import lru_cache
 import pickle
 import pandas as pd
+import numpy as np
 
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+from petrovisor.api.utils.validators import Validator
 from petrovisor.api.enums.internal_dtypes import SignalType
 from petrovisor.api.protocols.protocols import (
     SupportsRequests,
@@ -23,6 +33,291 @@ from petrovisor.api.protocols.protocols import (
     SupportsDataFrames,
 )
 
+# predefined column names used in return tables from api calls
+ENTITY_COL = "Entity"
+ALIAS_COL = "Alias"
+TYPE_COL = "Type"
+IS_OPPORTUNITY_COL = "IsOpportunity"
+DATE_COL = "Date"
+TIME_COL = "Time"
+DEPTH_COL = "Depth"
+
+# canonical data type names
+_DTYPE_ALIASES: Dict[str, str] = {
+    "numeric": "numeric",
+    "float64": "numeric",
+    "time": "time",
+    "datetime": "time",
+    "datetime64[ns]": "time",
+    "string": "string",
+    "str": "string",
+    "bool": "bool",
+    "boolean": "bool",
+    "unknown": "object",
+    "object": "object",
+}
+
+
+# check whether value is empty or whitespace-only string
+def _is_blank_str(value: Any) -> bool:
+    return isinstance(value, str) and (not value or value.isspace())
+
+
+# mask of empty or whitespace-only strings in Series
+def _blank_str_mask(s: pd.Series) -> np.ndarray:
+    # arrow-backed strings are checked with vectorized string methods
+    # (for 'object' and python-backed strings, these are slower than plain iteration)
+    if isinstance(s.dtype, pd.StringDtype) and s.dtype.storage == "pyarrow":
+        return s.str.strip().eq("").fillna(False).to_numpy(dtype=bool)
+    return np.fromiter(map(_is_blank_str, s.to_list()), dtype=bool, count=len(s))
+
+
+# check whether value is null or blank string
+def _is_null_or_blank(value: Any, is_null: bool) -> bool:
+    return is_null or _is_blank_str(value)
+
+
+# json valid 'numeric' value
+def _json_valid_numeric(obj: Any, value: Any, is_null: bool, **kwargs) -> Any:
+    # nan_value = pd.NA
+    # nan_value = np.nan
+    # nan_value = float('NaN')
+    return "NaN" if _is_null_or_blank(value, is_null) else value
+
+
+# json valid 'time' value
+def _json_valid_time(obj: Any, value: Any, is_null: bool, **kwargs) -> Any:
+    if _is_null_or_blank(value, is_null):
+        return None
+    return obj.datetime_to_string(value, **kwargs)
+
+
+# json valid 'string' value
+def _json_valid_string(obj: Any, value: Any, is_null: bool, **kwargs) -> Any:
+    return "" if is_null else value
+
+
+# json valid 'bool' or 'object' value
+def _json_valid_object(obj: Any, value: Any, is_null: bool, **kwargs) -> Any:
+    return None if _is_null_or_blank(value, is_null) else value
+
+
+# json valid value of unknown data type
+def _json_valid_default(obj: Any, value: Any, is_null: bool, **kwargs) -> Any:
+    return None if is_null else value
+
+
+# json valid value handlers for canonical data types
+_JSON_VALUE_HANDLERS: Dict[str, Callable[..., Any]] = {
+    "numeric": _json_valid_numeric,
+    "time": _json_valid_time,
+    "string": _json_valid_string,
+    "bool": _json_valid_object,
+    "object": _json_valid_object,
+}
+
+# json valid value handlers for all data type names
+_JSON_VALUE_HANDLERS_BY_DTYPE: Dict[str, Callable[..., Any]] = {
+    dtype: _JSON_VALUE_HANDLERS[canonical_dtype]
+    for dtype, canonical_dtype in _DTYPE_ALIASES.items()
+}
+
+
+# data type names for corresponding signal types
+_SIGNAL_DATA_TYPE_NAMES: Dict[SignalType, str] = {
+    SignalType.Static: "numeric",
+    SignalType.TimeDependent: "numeric",
+    SignalType.DepthDependent: "numeric",
+    SignalType.PVT: "numeric",
+    SignalType.String: "string",
+    SignalType.StringTimeDependent: "string",
+    SignalType.StringDepthDependent: "string",
+}
+
+
+# data type names for corresponding signal type names
+_SIGNAL_TYPE_NAME_DATA_TYPES: Dict[str, str] = {
+    signal_type.name: dtype for signal_type, dtype in _SIGNAL_DATA_TYPE_NAMES.items()
+}
+
+# signal type names grouped by signal index
+_STATIC_SIGNAL_TYPE_NAMES = frozenset({SignalType.Static.name, SignalType.String.name})
+_TIME_SIGNAL_TYPE_NAMES = frozenset(
+    {SignalType.TimeDependent.name, SignalType.StringTimeDependent.name}
+)
+_DEPTH_SIGNAL_TYPE_NAMES = frozenset(
+    {SignalType.DepthDependent.name, SignalType.StringDepthDependent.name}
+)
+
+
+# get SignalType enum from signal type name
+@lru_cache(maxsize=256)
+def _signal_type_from_str(signal_type: str) -> SignalType:
+    return Validator.get_signal_type_enum(signal_type)
+
+
+# get data type name from signal type name
+@lru_cache(maxsize=256)
+def _signal_data_type_name_from_str(signal_type: str) -> str:
+    return _SIGNAL_DATA_TYPE_NAMES[_signal_type_from_str(signal_type)]
+
+
+# unit part of column name, e.g. 'Oil [bbl]'
+_COLUMN_UNIT_RE = re.compile(r"\[([^\]]*)\]")
+
+
+# split column name into name and unit
+@lru_cache(maxsize=4096)
+def _split_column_name_and_unit(column_name: str) -> Tuple[str, str]:
+    cunit = _COLUMN_UNIT_RE.search(column_name)
+    return column_name.partition("[")[0].strip(), cunit.group(1) if cunit else ""
+
+
+# get signal name and unit from signal specified as 'Name [Unit]'
+def _signal_spec_from_str(
+    signal: str, column_name: str, column_unit: str
+) -> Tuple[str, str]:
+    signal_name, signal_unit = _split_column_name_and_unit(signal)
+    return signal_name, signal_unit if signal_unit else column_unit
+
+
+# get signal name and unit from signal specified as (Name, Unit)
+def _signal_spec_from_sequence(
+    signal: Union[Tuple, List], column_name: str, column_unit: str
+) -> Tuple[str, str]:
+    return signal[0], signal[1] if (len(signal) > 1) else column_unit
+
+
+# get signal name and unit from signal specified as {'Signal': Name, 'Unit': Unit}
+def _signal_spec_from_dict(
+    signal: Dict, column_name: str, column_unit: str
+) -> Tuple[str, str]:
+    signal_name = column_name
+    signal_unit = column_unit
+    for fname in ["Signal", "Name", "SignalName"]:
+        if fname in signal:
+            signal_name = signal[fname]
+            break
+        elif fname.lower() in signal:
+            signal_name = signal[fname.lower()]
+            break
+    for fname in ["Unit", "UnitName", "SignalUnit"]:
+        if fname in signal:
+            signal_unit = signal[fname]
+            break
+        elif fname.lower() in signal:
+            signal_unit = signal[fname.lower()]
+            break
+    return signal_name, signal_unit
+
+
+# handlers of signal specification types
+_SIGNAL_SPEC_HANDLERS: Dict[type, Callable[..., Tuple[str, str]]] = {
+    str: _signal_spec_from_str,
+    tuple: _signal_spec_from_sequence,
+    list: _signal_spec_from_sequence,
+}
+
+
+# keyword arguments accepted by 'pd.to_datetime'
+_TO_DATETIME_ARGS = frozenset(
+    {
+        "errors",
+        "dayfirst",
+        "yearfirst",
+        "utc",
+        "format",
+        "exact",
+        "unit",
+        "infer_datetime_format",
+        "origin",
+        "cache",
+    }
+)
+
+# ISO 8601 formats which can be parsed by 'ciso8601', and layouts of matching strings
+# ('0' stands for digit), together with minimum string length ('%f' has 1 to 6 digits)
+_ISO_DATETIME_LAYOUTS: Dict[str, Tuple[str, int]] = {
+    "%Y-%m-%d": ("0000-00-00", 10),
+    "%Y-%m-%d %H:%M:%S": ("0000-00-00 00:00:00", 19),
+    "%Y-%m-%dT%H:%M:%S": ("0000-00-00T00:00:00", 19),
+    "%Y-%m-%dT%H:%M:%S.%f": ("0000-00-00T00:00:00.000000", 21),
+}
+
+# table replacing digits with '0', so that string can be compared with layout
+_DIGITS_TO_ZERO = str.maketrans("123456789", "000000000")
+
+
+# formats of date strings accepted by 'datetime_to_string'
+_DATE_STRING_FORMATS: Tuple[str, ...] = (
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    # other formats might be added
+)
+
+# patterns of date strings, which are parsed the same by 'pd.to_datetime' and 'strptime' with given format
+# ('pd.to_datetime' also accepts e.g. nanoseconds or timezone suffix, which 'strptime' rejects)
+_DATE_STRING_PATTERNS: Dict[str, str] = {
+    "%Y-%m-%d": r"[0-9]{4}-[0-9]{2}-[0-9]{2}",
+    "%Y-%m-%dT%H:%M:%S": r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}",
+    "%Y-%m-%dT%H:%M:%S.%f": r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]{1,6}",
+}
+
+# order in which formats are tried, starting with the format guessed from date string
+_DATE_STRING_FORMATS_ORDER: Dict[str, Tuple[str, ...]] = {
+    format_str: (format_str,)
+    + tuple(f for f in _DATE_STRING_FORMATS if f != format_str)
+    for format_str in _DATE_STRING_FORMATS
+}
+
+
+# reformat date string to desired format, or return it as is if it couldn't be parsed
+def _reformat_date_string(date_string: str, desired_format: str) -> str:
+    # formats are mutually exclusive, so only the order of attempts is affected by guess
+    if "." in date_string:
+        guessed_format = "%Y-%m-%dT%H:%M:%S.%f"
+    elif "T" in date_string:
+        guessed_format = "%Y-%m-%dT%H:%M:%S"
+    else:
+        guessed_format = "%Y-%m-%d"
+    for format_str in _DATE_STRING_FORMATS_ORDER[guessed_format]:
+        try:
+            date_object = datetime.strptime(date_string, format_str)
+            return date_object.strftime(desired_format)
+        except ValueError:
+            pass
+    return str(date_string).strip()
+
+
+# get parser converting string to datetime for given format
+@lru_cache(maxsize=32)
+def _get_datetime_parser(format: str) -> Callable[[str], datetime]:
+    def parse_datetime(d: str) -> datetime:
+        return datetime.strptime(d, format)
+
+    if ciso8601 is None or format not in _ISO_DATETIME_LAYOUTS:
+        return parse_datetime
+    layout, min_length = _ISO_DATETIME_LAYOUTS[format]
+    max_length = len(layout)
+
+    # 'ciso8601' accepts other ISO 8601 variants (e.g. basic format, timezone or hour 24),
+    # so that it is used only for strings exactly matching format, which 'strptime' accepts too
+    def parse_iso_datetime(d: str) -> datetime:
+        if (
+            isinstance(d, str)
+            and min_length <= len(d) <= max_length
+            and d.translate(_DIGITS_TO_ZERO) == layout[: len(d)]
+            and d[11:13] != "24"
+        ):
+            try:
+                return ciso8601.parse_datetime(d)
+            except ValueError:
+                pass
+        return parse_datetime(d)
+
+    return parse_iso_datetime
+
 
 # DataFrames utilities
 class DataFrameMixin(
@@ -41,6 +336,7 @@ class DataFrameMixin(
         df: pd.DataFrame,
         file_name: str,
         date_format: Optional[str] = None,
+        compresslevel: int = 1,
         **kwargs,
     ) -> io.BytesIO:
         """
@@ -51,37 +347,58 @@ class DataFrameMixin(
         df : DataFrame
             DataFrame
         file_name : str
-            File name
+            File name. Format is defined by extension: '.csv', '.xlsx', '.parquet' or '.pq', '.feather'.
+            Otherwise DataFrame is pickled
         date_format : str, default None
             Date format
+        compresslevel : int, default 1
+            Compression level used for pickled DataFrame
         """
         if not isinstance(df, (pd.DataFrame, pd.Series)):
             return df
         if file_name.lower().endswith(".csv"):
+            # csv is buffered in memory rather than streamed,
+            # since multipart upload reads the whole file into the request body anyway
             file_obj = io.BytesIO()
-            if date_format:
-                df.to_csv(
-                    file_obj,
-                    header=True,
-                    index=False,
-                    encoding="utf-8",
-                    mode="wb",
-                    date_format="%Y-%m-%dT%H:%M:%S.%fZ",
-                )
-            else:
-                df.to_csv(
-                    file_obj, header=True, index=False, encoding="utf-8", mode="wb"
-                )
+            df.to_csv(
+                file_obj,
+                header=True,
+                index=False,
+                encoding="utf-8",
+                mode="wb",
+                date_format="%Y-%m-%dT%H:%M:%S.%fZ" if date_format else None,
+            )
             file_obj.seek(0)
         elif file_name.lower().endswith(".xlsx"):
             file_obj = io.BytesIO()
+            # xlsxwriter 'constant_memory' mode is not used,
+            # since pandas writes cells column by column and earlier rows would be lost
             with pd.ExcelWriter(file_obj, engine="xlsxwriter") as writer:
                 df.to_excel(writer, index=False)
             file_obj.seek(0)
+        elif file_name.lower().endswith((".parquet", ".pq")):
+            file_obj = io.BytesIO()
+            DataFrameMixinHelper.check_arrow_installed(
+                "convert_dataframe_to_file_object", file_name
+            )
+            df_to_write = df.to_frame() if isinstance(df, pd.Series) else df
+            df_to_write.to_parquet(file_obj, compression="snappy")
+            file_obj.seek(0)
+        elif file_name.lower().endswith(".feather"):
+            file_obj = io.BytesIO()
+            DataFrameMixinHelper.check_arrow_installed(
+                "convert_dataframe_to_file_object", file_name
+            )
+            df_to_write = df.to_frame() if isinstance(df, pd.Series) else df
+            df_to_write.reset_index(drop=True).to_feather(file_obj, compression="zstd")
+            file_obj.seek(0)
         else:
             try:
                 file_obj = io.BytesIO()
-                df.to_pickle(file_obj, compression="gzip")
+                df.to_pickle(
+                    file_obj,
+                    compression={"method": "gzip", "compresslevel": compresslevel},
+                )
                 file_obj.seek(0)
             except Exception:
                 file_obj = io.BytesIO(pickle.dumps(df))
@@ -113,6 +430,8 @@ class DataFrameMixin(
                 # get columns
                 cols = data[0]
                 if len(data) > 1:
+                    # rows are passed as is, since transposing them into columns
+                    # (or using 'from_records') is slower than the list-of-lists constructor
                     df = pd.DataFrame(data=data[1:], columns=cols)
                 else:
                     df = pd.DataFrame(columns=cols)
@@ -125,12 +444,12 @@ class DataFrameMixin(
                 columns_dtype = {col: ctype for col, ctype in zip(columns, schema)}
             else:
                 columns_dtype = {}
-                entity_col = self.get_entity_column_name(**kwargs)
-                entity_type_col = self.get_entity_type_column_name(**kwargs)
-                alias_col = self.get_alias_column_name(**kwargs)
-                is_opportunity_col = self.get_opportunity_column_name(**kwargs)
-                date_col = self.get_date_column_name(**kwargs)
-                time_col = self.get_time_column_name(**kwargs)
+                entity_col = ENTITY_COL
+                entity_type_col = TYPE_COL
+                alias_col = ALIAS_COL
+                is_opportunity_col = IS_OPPORTUNITY_COL
+                date_col = DATE_COL
+                time_col = TIME_COL
                 for col in [date_col, time_col]:
                     columns_dtype[col] = "Time"
                 for col in [entity_col, alias_col, entity_type_col]:
@@ -140,7 +459,10 @@ class DataFrameMixin(
 
             # group by entity
             if groupby_entity:
-                df = {e: df_group for e, df_group in df.groupby(entity_col)}
+                df = {
+                    e: df_group
+                    for e, df_group in df.groupby(ENTITY_COL, sort=False, observed=True)
+                }
         except BaseException:
             raise RuntimeError(
                 "PetroVisor::convert_pivot_table_to_dataframe(): "
@@ -175,10 +497,10 @@ class DataFrameMixin(
             return None
 
         # standard columns
-        entity_col = self.get_entity_column_name()
-        alias_col = self.get_alias_column_name()
-        date_col = self.get_date_column_name()
-        depth_col = self.get_depth_column_name()
+        entity_col = ENTITY_COL
+        alias_col = ALIAS_COL
+        date_col = DATE_COL
+        depth_col = DEPTH_COL
         # known column types
         columns_dtype = {
             entity_col: "String",
@@ -205,13 +527,18 @@ class DataFrameMixin(
                 df = self.assign_dataframe_column_types(df, columns_dtype, **kwargs)
                 # group by entity
                 if groupby_entity:
-                    df = {e: df_group for e, df_group in df.groupby(entity_col)}
+                    df = {
+                        e: df_group
+                        for e, df_group in df.groupby(
+                            entity_col, sort=False, observed=True
+                        )
+                    }
                 # convert to wide format with columns format "{entity_name} : {column_name}"
                 elif has_entity_col and not with_entity_column:
-                    df = self.convert_dataframe_from_long_to_wide(df)
+                    df = self.convert_dataframe_from_long_to_wide(df, inplace=True)
                 # convert to long format with 'Entity' column
                 elif not has_entity_col and with_entity_column:
-                    df = self.convert_dataframe_from_wide_to_long(df)
+                    df = self.convert_dataframe_from_wide_to_long(df, inplace=True)
 
             # special case when columns have format "{entity_name} : {column_name}"
             # and group by entity is required
@@ -222,22 +549,15 @@ class DataFrameMixin(
                 col_entities = DataFrameMixinHelper.get_entities_from_columns(columns)
                 # list of all entities
                 entities = DataFrameMixinHelper.get_unique_non_empty_names(col_entities)
-                # create DataFrame
+                # create DataFrame by splitting rows once
+                df_all = DataFrameMixinHelper.create_dataframe_from_list(psharp_table)
                 df = {}
                 for e in entities:
-                    e_columns = [
-                        cname
-                        for ce, cname in zip(col_entities, col_names)
-                        if not ce or ce == e
+                    e_indices = [
+                        i for i, ce in enumerate(col_entities) if not ce or ce == e
                     ]
-                    df[e] = pd.DataFrame(
-                        [
-                            cv
-                            for row in psharp_table[1:]
-                            for cv, ce in zip(row.split("\t"), col_entities)
-                            if not ce or ce == e
-                        ],
-                        columns=e_columns,
+                    df[e] = df_all.iloc[:, e_indices].set_axis(
+                        [col_names[i] for i in e_indices], axis=1
                     )
 
                 # assign column types
@@ -281,6 +601,7 @@ class DataFrameMixin(
             value_field = "Value"
             # result_field = ''
             fields = []
+            col_frames = []
             for i, table_fields in enumerate(
                 [
                     [
@@ -294,7 +615,6 @@ class DataFrameMixin(
                 ]
             ):
                 is_not_full_spec = i == 0
-                entity_field = "EntityName" if is_not_full_spec else "Entity"
                 # non-empty fields
                 fields = [
                     field
@@ -322,46 +642,55 @@ class DataFrameMixin(
                             columns_dtype[columns_short_to_long[col_name]] = col_dtype
                         else:
                             full_column_name = columns_short_to_long[col_name]
-                        # change entity field to 'Entity'
-                        if entity_field != entity_col:
-                            col[entity_col] = col.pop(entity_field)
-                        # change value field to column name
-                        for d in col[data_field]:
-                            d[full_column_name] = d.pop(value_field)
+                        # create column DataFrame with value field renamed to column name
+                        # (records share the same fields, so build it column-wise)
+                        col_data = col[data_field]
+                        if col_data:
+                            col_df = pd.DataFrame(
+                                {
+                                    (
+                                        full_column_name
+                                        if field == value_field
+                                        else field
+                                    ): [record.get(field) for record in col_data]
+                                    for field in col_data[0]
+                                }
+                            )
+                            col_df[entity_col] = col_entity_name
+                            col_frames.append(col_df)
                 if fields:
                     break
             if not fields:
                 return None
 
             # create DataFrame
-            df = pd.json_normalize(
-                (
-                    [values for field in fields for values in psharp_table[field]]
-                    if len(fields) > 1
-                    else psharp_table[fields[0]]
-                ),
-                record_path=data_field,
-                meta=[entity_col],
-                errors="ignore",
+            df = (
+                pd.concat(col_frames, ignore_index=True)
+                if col_frames
+                else pd.DataFrame(columns=[entity_col])
             )
 
             # reorder columns
-            offset = 0
-            reordered_columns = list(df.columns)
+            df_columns = set(df.columns)
             # first columns 'Date', 'Depth', 'Entity'
-            for col in [entity_col, depth_col, date_col]:
-                if col in reordered_columns:
-                    reordered_columns.remove(col)
-                    reordered_columns.insert(0, col)
-                    offset += 1
+            first_columns = [
+                col for col in [date_col, depth_col, entity_col] if col in df_columns
+            ]
             # arrange other columns according to results order
-            for idx, col in enumerate(columns_short):
-                full_column_name = columns_short_to_long[col]
-                if full_column_name in reordered_columns:
-                    reordered_columns.remove(full_column_name)
-                    reordered_columns.insert(offset + idx, full_column_name)
-                else:
-                    offset -= 1
+            result_columns = [
+                full_column_name
+                for full_column_name in dict.fromkeys(
+                    columns_short_to_long[col] for col in columns_short
+                )
+                if full_column_name in df_columns
+            ]
+            # keep remaining columns at the end
+            arranged_columns = set(first_columns).union(result_columns)
+            reordered_columns = [
+                *first_columns,
+                *result_columns,
+                *(col for col in df.columns if col not in arranged_columns),
+            ]
 
             # arrange columns according to results order
             df = df[reordered_columns]
@@ -376,10 +705,13 @@ class DataFrameMixin(
 
             # group by entity
             if groupby_entity:
-                df = {e: df_group for e, df_group in df.groupby(entity_col)}
+                df = {
+                    e: df_group
+                    for e, df_group in df.groupby(entity_col, sort=False, observed=True)
+                }
             # convert to wide format with columns format "{entity_name} : {column_name"
             elif not with_entity_column:
-                df = self.convert_dataframe_from_long_to_wide(df)
+                df = self.convert_dataframe_from_long_to_wide(df, inplace=True)
         else:
             raise ValueError(
                 "PetroVisor::convert_psharp_table_to_dataframe(): "
@@ -402,6 +734,47 @@ class DataFrameMixin(
         """
         Get signal data from DataFrame
 
+        Parameters
+        ----------
+        df : DataFrame
+            Table
+        signals : dict, default None
+            Dictionary map from 'table column name' to 'workspace signal name'
+        entities : dict, default None
+            Dictionary map from 'table entity name' to 'workspace entity name'
+        only_existing_entities : bool, default True
+            Save data only if entity exist in workspace
+        entity_type : str, default None
+            Save data only for specified entity type
+        """
+        # data containers
+        data_to_save = {s.name: [] for s in SignalType}
+        for signal_type, signal_data in self.iter_signal_data_from_dataframe(
+            df,
+            signals=signals,
+            only_existing_entities=only_existing_entities,
+            entity_type=entity_type,
+            entities=entities,
+            **kwargs,
+        ):
+            data_to_save[signal_type].append(signal_data)
+        return data_to_save
+
+    # iterate over signal data from DataFrame
+    def iter_signal_data_from_dataframe(
+        self,
+        df: pd.DataFrame,
+        signals: Optional[Dict] = None,
+        only_existing_entities: bool = True,
+        entity_type: str = "",
+        entities: Optional[Dict] = None,
+        **kwargs,
+    ) -> Iterator[Tuple[str, Dict]]:
+        """
+        Iterate over signal data from DataFrame.
+        Yields tuples of signal type name and data of single signal of single entity,
+        data is built only when requested
+
         Parameters
         ----------
         df : DataFrame
@@ -420,29 +793,23 @@ class DataFrameMixin(
         # num_cols = len(columns)
 
         # standard columns
-        entity_col = self.get_entity_column_name()
-        alias_col = self.get_alias_column_name()
-        date_col = self.get_date_column_name()
-        depth_col = self.get_depth_column_name()
+        entity_col = ENTITY_COL
+        alias_col = ALIAS_COL
+        date_col = DATE_COL
+        depth_col = DEPTH_COL
 
         # entities map
-        entities_map = copy.deepcopy(entities) if entities else {}
+        entities_map = dict(entities) if entities else {}
 
         # filter out undefined entities
         select_entities = (
-            self.get_entity_names(entity_type=entity_type, **kwargs)
+            set(self.get_entity_names(entity_type=entity_type, **kwargs))
             if only_existing_entities
             else None
         )
         if select_entities and entities_map:
             entities_map_rev = {v: k for k, v in entities_map.items()}
-            select_entities = [
-                entities_map_rev[e] if (e in entities_map_rev) else e
-                for e in select_entities
-            ]
-
-        # data containers
-        data_to_save = {s.name: [] for s in SignalType}
+            select_entities = {entities_map_rev.get(e, e) for e in select_entities}
 
         # collect data info
         with_entity_col = entity_col in columns
@@ -469,9 +836,7 @@ class DataFrameMixin(
             # get column names
             col_names = columns
             # get list of entities
-            entities = (
-                list(set(df[entity_col].tolist())) if (entity_col in columns) else []
-            )
+            entities = df[entity_col].unique().tolist()
             # get column data info
             col_data = {
                 e: [(cname, cidx) for cidx, cname in enumerate(columns)]
@@ -479,36 +844,30 @@ class DataFrameMixin(
                 if (select_entities is None) or (e in select_entities)
             }
 
-        # remap entities data
-        if entities_map:
-            col_data = {
-                entities_map[e] if (e in entities_map) else e: d
-                for e, d in col_data.items()
-            }
+        # first position of each column name, with and without unit
+        col_index_by_name = {}
+        col_index_by_name_without_unit = {}
+        for i, column_name in enumerate(col_names):
+            col_index_by_name.setdefault(column_name, i)
+            col_index_by_name_without_unit.setdefault(
+                self.get_column_name_without_unit(column_name), i
+            )
 
         # 'Date' column
-        date_index = None
-        for i, column_name in enumerate(col_names):
-            if column_name == date_col:
-                date_index = i
-                break
+        date_index = col_index_by_name.get(date_col)
 
         # 'Depth' column
-        depth_index = None
-        for i, column_name in enumerate(col_names):
-            if (
-                column_name == depth_col
-                or self.get_column_name_without_unit(column_name) == depth_col
-            ):
-                depth_index = i
-                break
+        depth_index = col_index_by_name_without_unit.get(depth_col)
 
         # get signal info
         def _get_signal_info(
-            column_name: str, signal_names: List[str], signals: Optional[Dict] = None
+            column_name: str,
+            existing_signals: Dict[str, Dict],
+            signals: Optional[Dict] = None,
         ):
-            column_name_without_unit = self.get_column_name_without_unit(column_name)
-            column_unit_name = self.get_column_unit(column_name)
+            column_name_without_unit, column_unit_name = self.get_column_name_and_unit(
+                column_name
+            )
             if signals:
                 signal = (
                     signals[column_name]
@@ -524,38 +883,13 @@ class DataFrameMixin(
             if not signal:
                 signal_name = column_name_without_unit
                 signal_unit = column_unit_name
-            elif isinstance(signal, str):
-                signal_name_without_unit = self.get_column_name_without_unit(signal)
-                signal_unit_name = self.get_column_unit(signal)
-                signal_name = signal_name_without_unit
-                signal_unit = signal_unit_name if signal_unit_name else column_unit_name
-            elif (
-                isinstance(signal, tuple)
-                or isinstance(signal, list)
-                and len(signal) > 0
-            ):
-                signal_name = signal[0]
-                signal_unit = signal[1] if (len(signal) > 1) else column_unit_name
             else:
-                signal_name = self.get_column_name_without_unit(column_name)
-                signal_unit = self.get_column_unit(column_name)
-                for fname in ["Signal", "Name", "SignalName"]:
-                    if fname in signal:
-                        signal_name = signal[fname]
-                        break
-                    elif fname.lower() in signal:
-                        signal_name = signal[fname.lower()]
-                        break
-                for fname in ["Unit", "UnitName", "SignalUnit"]:
-                    if fname in signal:
-                        signal_unit = signal[fname]
-                        break
-                    elif fname.lower() in signal:
-                        signal_unit = signal[fname.lower()]
-                        break
+                signal_name, signal_unit = _SIGNAL_SPEC_HANDLERS.get(
+                    type(signal), _signal_spec_from_dict
+                )(signal, column_name_without_unit, column_unit_name)
             # get signal
-            if signal_name in signal_names:
-                signal_obj = self.get_signal(signal_name, **kwargs)
+            if signal_name in existing_signals:
+                signal_obj = existing_signals[signal_name]
                 if signal_obj:
                     if not signal_unit and "StorageUnitName" in signal_obj:
                         signal_unit = signal_obj["StorageUnitName"]
@@ -571,29 +905,60 @@ class DataFrameMixin(
                     }
             return None
 
-        # check whether non index column
-        def _is_index_column(column_name: str) -> bool:
-            return column_name in {date_col, depth_col, entity_col, alias_col}
+        # row positions of each entity
+        entity_rows = (
+            df.groupby(entity_col, sort=False).indices if with_entity_col else {}
+        )
+
+        # column series by position
+        column_series = [df.iloc[:, i] for i in range(df.shape[1])]
 
         # get column data
-        def _get_column_data(column_index: int, entity_name: str) -> List:
+        def _get_column_data(
+            column_index: int, entity: Any, limit: Optional[int] = None
+        ) -> List:
+            if not with_entity_col:
+                return column_series[column_index].iloc[:limit].to_list()
+            return (
+                column_series[column_index]
+                .take(entity_rows.get(entity, [])[:limit])
+                .to_list()
+            )
+
+        # json valid column values converted once per column and data type
+        json_column_values = {}
+
+        # get json valid column data
+        def _get_json_column_data(column_index: int, entity: Any, dtype: str) -> List:
+            key = (column_index, dtype)
+            if key not in json_column_values:
+                json_column_values[key] = self.get_json_valid_values(
+                    column_series[column_index], dtype=dtype, **kwargs
+                )
+            values = json_column_values[key]
             if not with_entity_col:
-                return df.iloc[:, column_index].to_list()
-            return df[df[entity_col] == entity_name].iloc[:, column_index].to_list()
+                return values.tolist()
+            return values[entity_rows.get(entity, [])].tolist()
 
         # get signals
-        col_names = list(set(col_names))
-        existing_signal_names = self.get_signal_names(**kwargs)
+        index_columns = {date_col, depth_col, entity_col, alias_col}
+        # load all signals at once instead of requesting them one by one
+        existing_signals = {s["Name"]: s for s in self.get_signals(**kwargs)}
         column_signals = {
-            cname: _get_signal_info(cname, existing_signal_names, signals=signals)
-            for cname in col_names
-            if not _is_index_column(cname)
+            cname: _get_signal_info(cname, existing_signals, signals=signals)
+            for cname in col_index_by_name
+            if cname not in index_columns
         }
 
         # collect signals data
-        for _entity_name, d in col_data.items():
-            # make sure that entity column is string
-            entity_name = str(_entity_name)
+        for entity, d in col_data.items():
+            # remap entity and make sure that entity column is string
+            entity_name = str(
+                entities_map[entity] if (entity in entities_map) else entity
+            )
+            # 'Date' and 'Depth' values of entity shared by all its signals
+            entity_dates = None
+            entity_depths = None
             # collect signals data
             for col in d:
                 # column name
@@ -607,89 +972,68 @@ class DataFrameMixin(
                     signal_type = signal["SignalType"]
 
                     # static signal
-                    if signal_type in {SignalType.Static.name, SignalType.String.name}:
-                        dtype = "Numeric" if (signal_type == "Static") else "String"
-                        static_data = _get_column_data(column_index, entity_name)
+                    if signal_type in _STATIC_SIGNAL_TYPE_NAMES:
+                        dtype = _SIGNAL_TYPE_NAME_DATA_TYPES[signal_type]
+                        static_data = _get_column_data(column_index, entity, limit=1)
                         if static_data and len(static_data) > 0:
-                            value = (
-                                static_data[0]
-                                if (signal_type == "Static")
-                                else static_data[0]
-                            )
-                            data_to_save[signal_type].append(
-                                {
-                                    "Entity": entity_name,
-                                    "Signal": signal_name,
-                                    "Unit": signal_unit_name,
-                                    "Data": self.get_json_valid_value(
-                                        value, dtype=dtype, **kwargs
-                                    ),
-                                }
-                            )
-                    # time signal
-                    elif signal_type in (
-                        SignalType.TimeDependent.name,
-                        SignalType.StringTimeDependent.name,
-                    ):
-                        dtype = (
-                            "Numeric" if (signal_type == "TimeDependent") else "String"
-                        )
-                        data_to_save[signal_type].append(
-                            {
+                            value = static_data[0]
+                            yield signal_type, {
                                 "Entity": entity_name,
                                 "Signal": signal_name,
                                 "Unit": signal_unit_name,
-                                "Data": [
-                                    {
-                                        "Date": self.get_json_valid_value(
-                                            dvalue, dtype="Time", **kwargs
-                                        ),
-                                        "Value": self.get_json_valid_value(
-                                            value, dtype=dtype, **kwargs
-                                        ),
-                                    }
-                                    for dvalue, value in zip(
-                                        _get_column_data(date_index, entity_name),
-                                        _get_column_data(column_index, entity_name),
-                                    )
-                                ],
+                                "Data": self.get_json_valid_value(
+                                    value, dtype=dtype, **kwargs
+                                ),
                             }
-                        )
+                    # time signal
+                    elif signal_type in _TIME_SIGNAL_TYPE_NAMES:
+                        dtype = _SIGNAL_TYPE_NAME_DATA_TYPES[signal_type]
+                        if entity_dates is None:
+                            entity_dates = _get_json_column_data(
+                                date_index, entity, "Time"
+                            )
+                        yield signal_type, {
+                            "Entity": entity_name,
+                            "Signal": signal_name,
+                            "Unit": signal_unit_name,
+                            "Data": [
+                                {
+                                    "Date": dvalue,
+                                    "Value": value,
+                                }
+                                for dvalue, value in zip(
+                                    entity_dates,
+                                    _get_json_column_data(column_index, entity, dtype),
+                                )
+                            ],
+                        }
                     # depth signal
-                    elif signal_type in (
-                        SignalType.DepthDependent.name,
-                        SignalType.StringDepthDependent.name,
-                    ):
-                        dtype = (
-                            "Numeric" if (signal_type == "DepthDependent") else "String"
-                        )
-                        data_to_save[signal_type].append(
-                            {
-                                "Entity": entity_name,
-                                "Signal": signal_name,
-                                "Unit": signal_unit_name,
-                                "Data": [
-                                    {
-                                        "Depth": self.get_json_valid_value(
-                                            dvalue, dtype="Numeric", **kwargs
-                                        ),
-                                        "Value": self.get_json_valid_value(
-                                            value, dtype=dtype, **kwargs
-                                        ),
-                                    }
-                                    for dvalue, value in zip(
-                                        _get_column_data(depth_index, entity_name),
-                                        _get_column_data(column_index, entity_name),
-                                    )
-                                ],
-                            }
-                        )
+                    elif signal_type in _DEPTH_SIGNAL_TYPE_NAMES:
+                        dtype = _SIGNAL_TYPE_NAME_DATA_TYPES[signal_type]
+                        if entity_depths is None:
+                            entity_depths = _get_json_column_data(
+                                depth_index, entity, "Numeric"
+                            )
+                        yield signal_type, {
+                            "Entity": entity_name,
+                            "Signal": signal_name,
+                            "Unit": signal_unit_name,
+                            "Data": [
+                                {
+                                    "Depth": dvalue,
+                                    "Value": value,
+                                }
+                                for dvalue, value in zip(
+                                    entity_depths,
+                                    _get_json_column_data(column_index, entity, dtype),
+                                )
+                            ],
+                        }
                     else:
                         raise ValueError(
-                            f"PetroVisor::get_signal_data_from_dataframe(): "
+                            f"PetroVisor::iter_signal_data_from_dataframe(): "
                             f"signal type: '{signal_type}' is not supported yet."
                         )
-        return data_to_save
 
     # convert dataframe from wide to long format
     def convert_dataframe_from_wide_to_long(
@@ -709,12 +1053,14 @@ class DataFrameMixin(
         """
 
         # standard columns
-        entity_col = self.get_entity_column_name()
+        entity_col = ENTITY_COL
 
         # define column indices and entities
+        # (column names are iterated as list, which is faster than both iterating 'Index'
+        # and splitting names with 'Index.str.split')
         column_indices = []
         entity_columns = []
-        for col in df.columns:
+        for col in df.columns.tolist():
             c = col.split(" : ")
             if len(c) > 1:
                 entity_columns.append((c[0], c[1]))
@@ -732,6 +1078,7 @@ class DataFrameMixin(
             entity_columns, names=[entity_col, None]
         )
         # stack entity column and reset index
+        # ('melt' is not used, since it would put all value columns into a single 'object' column)
         return df_long.stack(0).reset_index().drop(columns=default_index_col)
 
     # convert dataframe from long to wide format
@@ -746,6 +1093,7 @@ class DataFrameMixin(
         Convert DataFrame from long to wide format.
         Wide format assumes column names as '{entity_name} : {column_name}'
         Long format assumes that DataFrame has 'Entity' column.
+        Each row of long format is kept as a separate row, rows are not aligned by indices columns.
 
         Parameters
         ----------
@@ -758,19 +1106,20 @@ class DataFrameMixin(
         """
 
         # check whether entity column is present
-        entity_col = self.get_entity_column_name()
+        entity_col = ENTITY_COL
         if entity_col not in df.columns:
             return df
 
         # define column indices
-        date_col = self.get_date_column_name()
-        depth_col = self.get_depth_column_name()
-        alias_col = self.get_alias_column_name()
-        column_indices = (
-            copy.deepcopy(indices)
-            if indices
-            else [date_col, depth_col, alias_col, entity_col]
-        )
+        date_col = DATE_COL
+        depth_col = DEPTH_COL
+        alias_col = ALIAS_COL
+        if not indices:
+            column_indices = [date_col, depth_col, alias_col, entity_col]
+        elif isinstance(indices, str):
+            column_indices = [indices]
+        else:
+            column_indices = list(indices)
         if entity_col not in column_indices:
             column_indices.append(entity_col)
 
@@ -779,6 +1128,7 @@ class DataFrameMixin(
             df, column_indices, inplace=inplace, add_default_index=True, **kwargs
         )
         # unstack 'Entity' column
+        # ('pivot_table' is not used, since it would merge rows with the same indices)
         df_wide = (
             df_wide.unstack(entity_col)
             .reset_index()
@@ -808,38 +1158,54 @@ class DataFrameMixin(
         is_null = pd.isnull(value)
         if not isinstance(dtype, str):
             dtype = self.get_signal_data_type_name(dtype, **kwargs)
-        dtype = dtype.lower()
-        if dtype in {"numeric", "float64"}:
-            # nan_value = pd.NA
-            # nan_value = np.nan
-            # nan_value = float('NaN')
-            nan_value = "NaN"
-            return (
-                nan_value
-                if is_null or (isinstance(value, str) and not value.strip())
-                else value
-            )
-        elif dtype in {"time", "datetime", "datetime64[ns]"}:
-            return (
-                None
-                if is_null or (isinstance(value, str) and not value.strip())
-                else self.datetime_to_string(value, **kwargs)
-            )
-        elif dtype in {"string", "str"}:
-            return "" if is_null else value
-        elif dtype in {"bool", "boolean"}:
-            return (
-                None
-                if is_null or (isinstance(value, str) and not value.strip())
-                else value
+        handler = _JSON_VALUE_HANDLERS_BY_DTYPE.get(dtype.lower(), _json_valid_default)
+        return handler(self, value, is_null, **kwargs)
+
+    # get valid json values
+    def get_json_valid_values(
+        self, s: pd.Series, dtype: Union[str, SignalType] = "unknown", **kwargs
+    ) -> np.ndarray:
+        """
+        Convert Series values to json accepted format.
+        Same as 'get_json_valid_value' applied to each value, but vectorized where possible
+
+        Parameters
+        ----------
+        s : Series
+            Values
+        dtype : str | SignalType, default 'unknown'
+            data type: 'numeric' or 'float64', 'time', 'bool' or 'boolean', 'unknown' or 'object'
+        """
+        if not isinstance(dtype, str):
+            dtype = self.get_signal_data_type_name(dtype, **kwargs)
+        canonical_dtype = _DTYPE_ALIASES.get(dtype.lower(), "")
+        is_null = s.isna().to_numpy()
+        # datetime values are formatted at once
+        if canonical_dtype == "time":
+            if s.dtype.kind != "M":
+                is_null = is_null | _blank_str_mask(s)
+            values = self.datetimes_to_strings(s, **kwargs).to_numpy(
+                dtype=object, copy=True
             )
-        elif dtype in {"unknown", "object"}:
-            return (
-                None
-                if is_null or (isinstance(value, str) and not value.strip())
-                else value
+            values[is_null] = None
+            return values
+        # values of other types are converted one by one
+        # (method is bound once, instead of being looked up for each value)
+        if canonical_dtype not in {"numeric", "string"}:
+            get_json_valid_value = self.get_json_valid_value
+            return np.array(
+                [get_json_valid_value(v, dtype=dtype, **kwargs) for v in s.to_list()],
+                dtype=object,
             )
-        return None if is_null else value
+        values = s.to_numpy(dtype=object, copy=True)
+        if canonical_dtype == "string":
+            values[is_null] = ""
+            return values
+        # numeric values
+        if s.dtype.kind not in "biufc":
+            is_null = is_null | _blank_str_mask(s)
+        values[is_null] = "NaN"
+        return values
 
     # assign DataFrame column to corresponding types
     def assign_dataframe_column_types(
@@ -847,6 +1213,7 @@ class DataFrameMixin(
         df: pd.DataFrame,
         columns_dtype: Dict,
         default_dtype: Optional[str] = None,
+        categorical: bool = False,
         **kwargs,
     ) -> pd.DataFrame:
         """
@@ -860,13 +1227,32 @@ class DataFrameMixin(
             Dictionary {"column name" : "type"}
         default_dtype : str, default None
             Default type to use: 'numeric' or 'float64', 'time', 'bool' or 'boolean', 'unknown' or 'object'
-        """
-        columns = df.columns
-        for c in columns:
-            if c in columns_dtype:
-                df[c] = self.column_to_dtype(df, c, columns_dtype[c], **kwargs)
-            elif default_dtype:
-                df[c] = self.column_to_dtype(df, c, default_dtype, **kwargs)
+        categorical : bool, default False
+            Whether to convert low-cardinality 'string' columns to 'category' type
+        """
+        # target type names are resolved once per requested type
+        # (columns are still assigned one by one, since a single multi-column assignment
+        # or 'astype' with a dictionary of types are slower than separate column assignments)
+        dtype_names = {}
+        column_to_dtype = self.column_to_dtype
+        # columns, which already have requested type, are converted only if conversion arguments are specified
+        has_conversion_args = bool(kwargs.keys() & _TO_DATETIME_ARGS)
+        for c, column_dtype in df.dtypes.items():
+            dtype = columns_dtype[c] if (c in columns_dtype) else default_dtype
+            if not dtype:
+                continue
+            if (
+                categorical
+                and _DTYPE_ALIASES.get(dtype.lower()) == "string"
+                and DataFrameMixinHelper.is_low_cardinality(df[c])
+            ):
+                dtype = "category"
+            if dtype not in dtype_names:
+                dtype_names[dtype] = self.convert_to_dtype_name(dtype)
+            # skip assignment if column already has requested type
+            if not has_conversion_args and str(column_dtype) == dtype_names[dtype]:
+                continue
+            df[c] = column_to_dtype(df, c, dtype, **kwargs)
         return df
 
     # get DataFrame data type name
@@ -877,25 +1263,27 @@ class DataFrameMixin(
         Parameters
         ----------
         dtype : str
-            data type: 'numeric' or 'float64', 'time', 'bool' or 'boolean', 'unknown' or 'object'
+            data type: 'numeric' or 'float64', 'time', 'bool' or 'boolean', 'category', 'unknown' or 'object'
         """
         dtype = dtype.lower()
         if dtype in {"numeric", "float64"}:
             return "float64"
         elif dtype in {"time", "datetime", "datetime64[ns]"}:
             return "datetime64[ns]"
-        elif dtype in {"string"}:
+        elif dtype in {"string", "str"}:
             return "string"
         elif dtype in {"boolean", "bool"}:
             return "bool"
+        elif dtype in {"category"}:
+            return "category"
         elif dtype in {"unknown", "object"}:
             return "object"
         return "object"
 
-    # convert DataFrame column to bool
+    # convert DataFrame column to specified type
     def column_to_dtype(
         self, df: pd.DataFrame, column: str, dtype: str, **kwargs
-    ) -> pd.DataFrame:
+    ) -> pd.Series:
         """
         Convert DataFrame column to specified type
 
@@ -906,11 +1294,18 @@ class DataFrameMixin(
         column: str
             Column name
         dtype : str
-            data type: 'numeric' or 'float64', 'time', 'bool' or 'boolean', 'unknown' or 'object'
+            data type: 'numeric' or 'float64', 'time', 'bool' or 'boolean', 'category', 'unknown' or 'object'
         """
+        s = df[column]
         if not dtype:
-            return df[column]
+            return s
         dtype = dtype.lower()
+        # column already has requested type, and no conversion arguments are specified
+        has_conversion_args = bool(kwargs.keys() & _TO_DATETIME_ARGS)
+        if not has_conversion_args and str(s.dtype) == self.convert_to_dtype_name(
+            dtype, **kwargs
+        ):
+            return s
         if dtype in {"numeric", "float64"}:
             df[column] = self.column_to_numeric(df, column, **kwargs)
         elif dtype in {"time", "datetime", "datetime64[ns]"}:
@@ -919,6 +1314,8 @@ class DataFrameMixin(
             df[column] = self.column_to_string(df, column, **kwargs)
         elif dtype in {"bool", "boolean"}:
             df[column] = self.column_to_bool(df, column, **kwargs)
+        elif dtype in {"category"}:
+            df[column] = self.column_to_category(df, column, **kwargs)
         elif dtype in {"unknown", "object"}:
             df[column] = self.column_to_object(df, column, **kwargs)
         return df[column]
@@ -937,6 +1334,20 @@ class DataFrameMixin(
         """
         return df[column].astype("object")
 
+    # convert DataFrame column to 'category'
+    def column_to_category(self, df: pd.DataFrame, column: str, **kwargs) -> pd.Series:
+        """
+        Convert DataFrame column to 'category' type
+
+        Parameters
+        ----------
+        df : DataFrame
+            Table
+        column : str
+            Column name
+        """
+        return df[column].astype("category")
+
     # convert DataFrame column to 'bool'
     def column_to_bool(self, df: pd.DataFrame, column: str, **kwargs) -> pd.Series:
         """
@@ -978,7 +1389,11 @@ class DataFrameMixin(
             Column name
         """
         # return df[column].astype('float64')
-        return pd.to_numeric(df[column])
+        s = df[column]
+        # numeric columns are returned as is, 'to_numeric' would only copy them
+        if pd.api.types.is_numeric_dtype(s.dtype):
+            return s
+        return pd.to_numeric(s)
 
     # convert DataFrame column to 'datetime'
     def column_to_datetime(self, df: pd.DataFrame, column, **kwargs) -> pd.Series:
@@ -997,25 +1412,26 @@ class DataFrameMixin(
         # return pd.to_datetime(df[column], infer_datetime_format=True)
         # return pd.to_datetime(df[column], format=format)
         # return pd.to_datetime(df[column])
-        datetime_args = {
-            arg: kwargs[arg]
-            for arg in [
-                "errors",
-                "dayfirst",
-                "yearfirst",
-                "utc",
-                "format",
-                "exact",
-                "unit",
-                "infer_datetime_format",
-                "origin",
-                "cache",
-            ]
-            if (arg in kwargs)
-        }
+        datetime_args = {k: kwargs[k] for k in kwargs.keys() & _TO_DATETIME_ARGS}
+        s = df[column]
+        # datetime columns are returned as is, unless conversion arguments are specified
+        if not datetime_args and pd.api.types.is_datetime64_any_dtype(s.dtype):
+            return s
+        # integer timestamps can be cast directly, bypassing the slower parsing path
+        # (unsigned values are cast to 'int64' first, which pandas handles much faster)
+        unit = datetime_args.get("unit", "ns")
+        if (
+            s.dtype.kind in "iu"
+            and unit in {"s", "ms", "us", "ns"}
+            and not datetime_args.get("origin")
+            and not datetime_args.get("utc")
+        ):
+            return (
+                s.astype("int64").astype(f"datetime64[{unit}]").astype("datetime64[ns]")
+            )
         if datetime_args:
-            return pd.to_datetime(df[column], **datetime_args)
-        return pd.to_datetime(df[column])
+            return pd.to_datetime(s, **datetime_args)
+        return pd.to_datetime(s)
 
     # convert datetime to string
     def datetime_to_string(
@@ -1034,30 +1450,68 @@ class DataFrameMixin(
         format : str, default '%Y-%m-%dT%H:%M:%S.%f'
             Time format
         """
-
-        def parse_date(date_string: str, desired_format: str) -> str:
-            formats_to_try = [
-                "%Y-%m-%d",
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%dT%H:%M:%S.%f",
-                # other formats might be added
-            ]
-            for format_str in formats_to_try:
-                try:
-                    date_object = datetime.strptime(date_string, format_str)
-                    return date_object.strftime(desired_format)
-                except ValueError:
-                    pass
-            return str(date_string).strip()
-
         return (
             ""
             if pd.isnull(d)
             else (
-                d.strftime(format) if isinstance(d, datetime) else parse_date(d, format)
+                d.strftime(format)
+                if isinstance(d, datetime)
+                else _reformat_date_string(d, format)
             )
         )
 
+    # convert datetimes to strings
+    def datetimes_to_strings(
+        self,
+        s: pd.Series,
+        format: Optional[str] = "%Y-%m-%dT%H:%M:%S.%f",
+        **kwargs,
+    ) -> pd.Series:
+        """
+        Convert datetime values to string representation.
+        Same as 'datetime_to_string' applied to each value, but vectorized where possible
+
+        Parameters
+        ----------
+        s : Series
+            Dates
+        format : str, default '%Y-%m-%dT%H:%M:%S.%f'
+            Time format
+        """
+        is_null = s.isna()
+        # datetime values are formatted at once
+        if s.dtype.kind == "M":
+            return s.dt.strftime(format).astype(object).where(~is_null, "")
+        # method is bound once, instead of being looked up for each value
+        datetime_to_string = self.datetime_to_string
+        # positional index is used, since index labels might be duplicated
+        result = pd.Series("", index=pd.RangeIndex(len(s)), dtype=object)
+        values = s.reset_index(drop=True)[~is_null.to_numpy()]
+        # values of mixed types are converted one by one
+        if not all(isinstance(v, str) for v in values.to_list()):
+            result[values.index] = [
+                datetime_to_string(v, format=format, **kwargs) for v in values.to_list()
+            ]
+            return result.set_axis(s.index)
+        # date strings are parsed with the same formats as in 'datetime_to_string',
+        # if they exactly match format, so that they are parsed the same as by 'strptime'
+        for format_str in _DATE_STRING_FORMATS:
+            if values.empty:
+                break
+            is_matched = values.str.fullmatch(_DATE_STRING_PATTERNS[format_str])
+            dates = pd.to_datetime(
+                values[is_matched], format=format_str, errors="coerce"
+            )
+            dates = dates[dates.notna()]
+            result[dates.index] = dates.dt.strftime(format)
+            values = values.drop(dates.index)
+        # remaining strings are handled one by one
+        if not values.empty:
+            result[values.index] = [
+                datetime_to_string(v, format=format, **kwargs) for v in values.to_list()
+            ]
+        return result.set_axis(s.index)
+
     # convert string to datetime
     def string_to_datetime(
         self,
@@ -1072,10 +1526,10 @@ class DataFrameMixin(
         ----------
         d : str
             Date
-        format : str, default '%Y-%m-%dT%H:%M:%S.%f'
+        format : str, default '%Y-%m-%d %H:%M:%S'
             Time format
         """
-        return datetime.strptime(d, format)
+        return _get_datetime_parser(format)(d)
 
     # get column name without unit
     def get_column_name_without_unit(
@@ -1091,8 +1545,7 @@ class DataFrameMixin(
         """
         if not isinstance(column_name, str):
             return column_name
-        cname = column_name.split("[")[0].strip()
-        return cname
+        return _split_column_name_and_unit(column_name)[0]
 
     # get column unit
     def get_column_unit(self, column_name: str, **kwargs) -> str:
@@ -1106,11 +1559,7 @@ class DataFrameMixin(
         """
         if not isinstance(column_name, str):
             return ""
-        column_name = column_name.strip()
-        cunit = re.findall(r"\[(.*?)\]", column_name)
-        if cunit and len(cunit) > 0:
-            return cunit[0]
-        return ""
+        return _split_column_name_and_unit(column_name)[1]
 
     # get column name and unit
     def get_column_name_and_unit(self, column_name: str, **kwargs) -> Tuple[str, str]:
@@ -1124,59 +1573,56 @@ class DataFrameMixin(
         """
         if not isinstance(column_name, str):
             return column_name, ""
-        column_name = column_name.strip()
-        cname = self.get_column_name_without_unit(column_name, **kwargs)
-        cunit = self.get_column_unit(column_name, **kwargs)
-        return cname, cunit
+        return _split_column_name_and_unit(column_name)
 
     # get 'Entity' column name
     def get_entity_column_name(self, **kwargs) -> str:
         """
         Get predefined 'Entity' column name used in return tables from api calls
         """
-        return "Entity"
+        return ENTITY_COL
 
     # get 'Alias' column name
     def get_alias_column_name(self, **kwargs) -> str:
         """
         Get predefined 'Alias' column name used in return tables from api calls
         """
-        return "Alias"
+        return ALIAS_COL
 
     # get 'EntityType' column name
     def get_entity_type_column_name(self, **kwargs) -> str:
         """
         Get predefined 'Type' column name used in return tables from api calls
         """
-        return "Type"
+        return TYPE_COL
 
     # get 'Opportunity' column name
     def get_opportunity_column_name(self, **kwargs) -> str:
         """
         Get predefined 'IsOpportunity' column name used in return tables from api calls
         """
-        return "IsOpportunity"
+        return IS_OPPORTUNITY_COL
 
     # get 'Date' column name
     def get_date_column_name(self, **kwargs) -> str:
         """
         Get predefined 'Date' column name used in return tables from api calls
         """
-        return "Date"
+        return DATE_COL
 
     # get 'Time' column name
     def get_time_column_name(self, **kwargs) -> str:
         """
         Get predefined 'Time' column name used in return tables from api calls
         """
-        return "Time"
+        return TIME_COL
 
     # get 'Depth' column name
     def get_depth_column_name(self, **kwargs) -> str:
         """
         Get predefined 'Depth' column name used in return tables from api calls
         """
-        return "Depth"
+        return DEPTH_COL
 
     # get signal data type name
     def get_signal_data_type_name(
@@ -1191,26 +1637,15 @@ class DataFrameMixin(
             Signal type
         """
         if isinstance(signal_type, str):
-            signal_type = self.get_signal_type_enum(signal_type, **kwargs)
+            return _signal_data_type_name_from_str(signal_type)
         elif not isinstance(signal_type, SignalType):
             raise ValueError(
                 f"PetroVisor::get_signal_data_type_name(): "
                 f"unknown 'signal_type'! "
                 f"Should be one of {[t.name for t in SignalType]} or {SignalType.__name__} enum."
             )
-        if signal_type in {
-            SignalType.Static,
-            SignalType.TimeDependent,
-            SignalType.DepthDependent,
-            SignalType.PVT,
-        }:
-            return "numeric"
-        elif signal_type in {
-            SignalType.String,
-            SignalType.StringTimeDependent,
-            SignalType.StringDepthDependent,
-        }:
-            return "string"
+        if signal_type in _SIGNAL_DATA_TYPE_NAMES:
+            return _SIGNAL_DATA_TYPE_NAMES[signal_type]
         raise ValueError(
             f"PetroVisor::get_signal_data_type_name(): "
             f"'{signal_type}' is not supported yet."
@@ -1229,7 +1664,7 @@ class DataFrameMixin(
             Signal type
         """
         if isinstance(signal_type, str):
-            signal_type = self.get_signal_type_enum(signal_type, **kwargs)
+            signal_type = _signal_type_from_str(signal_type)
         elif not isinstance(signal_type, SignalType):
             raise ValueError(
                 f"PetroVisor::get_signal_range_type_name(): "
@@ -1277,6 +1712,32 @@ class DataFrameMixin(
 
 # DataFrame mixin helper
 class DataFrameMixinHelper:
+    # check whether optional dependency required to read and write file is installed
+    @staticmethod
+    def check_arrow_installed(func_name: str, file_name: str = "") -> None:
+        """
+        Check whether 'pyarrow' is installed, which is required by pandas
+        to read and write '.parquet' and '.feather' files ('.parquet' files can be also handled by 'fastparquet')
+
+        Parameters
+        ----------
+        func_name : str
+            Name of the function, which requires 'pyarrow'
+        file_name : str, default ''
+            File name
+        """
+        if importlib.util.find_spec("pyarrow") is not None:
+            return
+        if file_name.lower().endswith((".parquet", ".pq")) and importlib.util.find_spec(
+            "fastparquet"
+        ):
+            return
+        raise ImportError(
+            f"PetroVisor::{func_name}(): "
+            f"'pyarrow' is required to read or write '{file_name}'. "
+            f"Install it with 'pip install petrovisor[arrow]'"
+        )
+
     # set DataFrame indices
     @staticmethod
     def set_dataframe_index(
@@ -1297,7 +1758,8 @@ class DataFrameMixinHelper:
         indices : list
             Columns to use as indices
         inplace : bool, default False
-            Whether to modify DataFrame or to work with a copy
+            Whether to modify DataFrame or to work with a copy.
+            DataFrame with indices is always returned, passed DataFrame is not re-indexed
         add_default_index : bool, default False
             Whether to add default index column
         default_index_name : str, default 'index'
@@ -1307,8 +1769,6 @@ class DataFrameMixinHelper:
         -------
         Tuple (DataFrame, default_index_column)
         """
-        # define working DataFrame
-        df_with_index = df if inplace else df.copy()
         # get column indices
         idx = [item for item in indices if item in df.columns]
         # add default index
@@ -1316,19 +1776,35 @@ class DataFrameMixinHelper:
         if add_default_index:
             # get index name which does not match any column name
             def get_default_index_name(df: pd.DataFrame):
+                columns = set(df.columns)
                 index_name = default_index_name
                 i = 0
-                while index_name in df.columns:
+                while index_name in columns:
                     index_name = f"{default_index_name}_{i}"
                     i += 1
                 return index_name
 
             index_col = get_default_index_name(df)
-            df_with_index[index_col] = df_with_index.index
-            idx.insert(0, index_col)
+            # use existing index directly instead of materializing it as a column
+            idx.insert(0, df.index.rename(index_col))
         # set indices
-        df_with_index = df_with_index.set_index(idx)
-        return df_with_index, index_col
+        return df.set_index(idx), index_col
+
+    # check whether column has low cardinality
+    @staticmethod
+    def is_low_cardinality(s: pd.Series, max_ratio: float = 0.5, **kwargs) -> bool:
+        """
+        Check whether ratio of unique values to number of values is below threshold
+
+        Parameters
+        ----------
+        s : Series
+            Column
+        max_ratio : float, default 0.5
+            Maximum ratio of unique values to number of values
+        """
+        num_values = len(s)
+        return num_values > 0 and s.nunique(dropna=False) < max_ratio * num_values
 
     # create DataFrame from list
     @staticmethod
@@ -1386,4 +1862,4 @@ class DataFrameMixinHelper:
         x : list
             List of names
         """
-        return list(set([e for e in x if e]))
+        return list(dict.fromkeys(e for e in x if e))
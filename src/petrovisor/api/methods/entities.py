@@ -14,6 +14,9 @@ from petrovisor.api.protocols.protocols import (
     SupportsItemRequests,
 )
 
+# maximum number of entities, which are requested one by one instead of requesting all entities
+_MAX_ENTITIES_REQUESTED_BY_NAME = 16
+
 
 # Entities API calls
 class EntitiesMixin(SupportsItemRequests, SupportsRequests):
@@ -67,6 +70,12 @@ class EntitiesMixin(SupportsItemRequests, SupportsRequests):
             "IncludeOpportunities": include_opportunities,
         }
         options = ApiHelper.update_dict(options, **kwargs)
+        # get names of entities used by 'Signal'
+        entity_names = None
+        if signal:
+            entity_names = self.get_entity_names(
+                signal_type=None, signal=signal, **kwargs
+            )
         # get entities by 'Entity' type
         if entity_type:
             entities = self.get(
@@ -76,14 +85,53 @@ class EntitiesMixin(SupportsItemRequests, SupportsRequests):
         else:
             entities = self.get(f"{route}/All", query=options, **kwargs)
         # get entities by 'Signal' name
-        if signal:
-            entity_names = self.get_entity_names(
-                signal_type=None, signal=signal, **kwargs
-            )
-            if entity_names:
-                return [e for e in entities if e["Name"] in entity_names]
+        if entities and entity_names:
+            entity_names = set(entity_names)
+            return [e for e in entities if e["Name"] in entity_names]
         return entities if entities is not None else []
 
+    # get entities by names
+    def get_entities_by_names(
+        self,
+        names: List[str],
+        max_requests: int = _MAX_ENTITIES_REQUESTED_BY_NAME,
+        **kwargs,
+    ) -> List[Dict]:
+        """
+        Get entities by names.
+        If there are at most 'max_requests' distinct names, then entities are requested one by one concurrently
+        (one request per name). Otherwise, all entities are requested with a single request,
+        and only entities which are not found by exact name are requested separately
+
+        Parameters
+        ----------
+        names : list
+            Entity names
+        max_requests : int, default 16
+            Maximum number of entities requested one by one, instead of requesting all entities
+        """
+        # request few entities one by one, instead of requesting all entities
+        unique_names = list(dict.fromkeys(names))
+        if len(unique_names) <= max_requests:
+            entities = ApiHelper.run_concurrently(
+                lambda name: self.get_entity(name, **kwargs), unique_names
+            )
+            entities_by_name = dict(zip(unique_names, entities))
+            return [entities_by_name[name] for name in names]
+        entities = self.get_entities(
+            include_entities=True, include_opportunities=True, **kwargs
+        )
+        entities_by_name = {e["Name"]: e for e in entities}
+        # entities which are not found by exact name are requested separately
+        return [
+            (
+                entities_by_name[name]
+                if name in entities_by_name
+                else self.get_entity(name, **kwargs)
+            )
+            for name in names
+        ]
+
     # get entity names
     def get_entity_names(
         self, entity_type: Optional[str] = "", signal: Optional[str] = "", **kwargs
@@ -112,6 +160,7 @@ class EntitiesMixin(SupportsItemRequests, SupportsRequests):
                     entity_type=entity_type, signal=None, **kwargs
                 )
                 if entity_type_names:
+                    entity_type_names = set(entity_type_names)
                     return [e for e in entity_names if e in entity_type_names]
         # get entities by 'Entity' type
         elif entity_type:
@@ -171,7 +220,7 @@ class EntitiesMixin(SupportsItemRequests, SupportsRequests):
         validated_entities = [
             e.model_dump(by_alias=True) if isinstance(e, Entity) else e
             for e in entities
-            if isinstance(e, dict) or isinstance(e, Entity)
+            if isinstance(e, (dict, Entity))
         ]
         return self.post(f"{route}/AddOrEdit", data=validated_entities, **kwargs)
 
@@ -210,11 +259,14 @@ class EntitiesMixin(SupportsItemRequests, SupportsRequests):
         """
         route = "Entities"
         names = [
-            e.name if isinstance(e, Entity) else ApiHelper.get_object_name(e)
-            for e in entities
-            if e
+            name
+            for name in (
+                e.name if isinstance(e, Entity) else ApiHelper.get_object_name(e)
+                for e in entities
+                if e
+            )
+            if name
         ]
-        names = [name for name in names if name]
         return self.post(f"{route}/Delete", data=names, **kwargs)
 
     # rename entity type
@@ -12,8 +12,13 @@ import pickle
 import pandas as pd
 
 from petrovisor.api.utils.helper import ApiHelper
+from petrovisor.api.methods.dataframes import DataFrameMixinHelper
 from petrovisor.api.protocols.protocols import SupportsRequests, SupportsDataFrames
 
+# pickle protocol used to upload objects, which is readable by all supported Python versions
+# (protocol 5 can't be read by Python 3.7)
+_PICKLE_PROTOCOL = min(pickle.HIGHEST_PROTOCOL, 4)
+
 
 # Files API calls
 class FilesMixin(SupportsDataFrames, SupportsRequests):
@@ -26,10 +31,12 @@ class FilesMixin(SupportsDataFrames, SupportsRequests):
         """
         Get file names
         """
-        return self.get("Files", **kwargs)
+        return self.get_cached("Files", **kwargs)
 
     # get file by name
-    def get_file(self, filename: str, format: str = "bytes", **kwargs) -> Any:
+    def get_file(
+        self, filename: str, format: str = "bytes", stream: bool = False, **kwargs
+    ) -> Any:
         """
         Get file
 
@@ -39,9 +46,16 @@ class FilesMixin(SupportsDataFrames, SupportsRequests):
             File name
         format : str, default 'bytes'
             File format
+        stream : bool, default False
+            Whether to return raw file stream, which is downloaded while being read,
+            instead of loading whole file content into memory
         """
         filename = ApiHelper.get_windows_like_path(filename)
-        return self.get(f"Files/{self.encode(filename)}", format=format, **kwargs)
+        if stream:
+            format = "raw"
+        return self.get(
+            f"Files/{self.encode(filename)}", format=format, stream=stream, **kwargs
+        )
 
     # delete file by given name
     def delete_file(self, filename: str, **kwargs) -> Any:
@@ -56,6 +70,28 @@ class FilesMixin(SupportsDataFrames, SupportsRequests):
         filename = ApiHelper.get_windows_like_path(filename)
         return self.delete(f"Files/{self.encode(filename)}", **kwargs)
 
+    # delete files by given names
+    def delete_files(
+        self, filenames: List[str], max_workers: int = 1, **kwargs
+    ) -> List[Any]:
+        """
+        Delete multiple files
+
+        Parameters
+        ----------
+        filenames : list[str]
+            File names
+        max_workers : int, default 1
+            Maximum number of files deleted concurrently. By default, files are deleted one by one.
+            If greater than 1, then files are deleted in arbitrary order, and if request fails,
+            then arbitrary subset of files might be already deleted
+        """
+        return ApiHelper.run_concurrently(
+            lambda filename: self.delete_file(filename, **kwargs),
+            filenames,
+            max_workers=max_workers,
+        )
+
     # upload file
     def upload_file(self, file: Any, name: str = "", **kwargs) -> Any:
         """
@@ -68,25 +104,29 @@ class FilesMixin(SupportsDataFrames, SupportsRequests):
         name : str
             File name
         """
+        # open file, which is closed after upload
+        if isinstance(file, str):
+            with open(file, "rb") as file_obj:
+                return self.upload_file(file_obj, name=name, **kwargs)
         # upload file with specified name
         if name:
             name = ApiHelper.get_unix_like_path(name)
             return self.post(
                 "Files/Upload",
-                files={
-                    "file": (name, open(file, "rb") if isinstance(file, str) else file)
-                },
+                files={"file": (name, file)},
                 **kwargs,
             )
         # upload file with the same name as file's name or name specified in the file-like object
         return self.post(
             "Files/Upload",
-            files={"file": open(file, "rb") if isinstance(file, str) else file},
+            files={"file": file},
             **kwargs,
         )
 
     # upload folder
-    def upload_folder(self, folder: str, name: str = "", **kwargs) -> Any:
+    def upload_folder(
+        self, folder: str, name: str = "", max_workers: int = 1, **kwargs
+    ) -> Any:
         """
         Upload folder
 
@@ -96,34 +136,52 @@ class FilesMixin(SupportsDataFrames, SupportsRequests):
             Folder path
         name : str
             Folder name
+        max_workers : int, default 1
+            Maximum number of files uploaded concurrently. By default, files are uploaded one by one.
+            If greater than 1, then files are uploaded in arbitrary order, and if request fails,
+            then arbitrary subset of files might be already uploaded
         """
         if not os.path.isdir(folder):
             return
         # validate new folder name
         if name:
-            name = ApiHelper.get_unix_like_path(name)
-        # upload folder with specified name
-        folder_relpath: str = os.path.dirname(folder)
-        for root, dirs, files in os.walk(folder):
-            for filename in files:
-                file_path = os.path.join(root, filename)
-
-                # get file relative path
-                root_relpath = os.path.relpath(root, folder_relpath)
-                if name:
-                    parts = root_relpath.split(os.sep)
-                    parts[0] = name
-                    root_relpath = os.sep.join(parts)
-
-                # get file relative path
-                file_relpath = os.path.join(root_relpath, filename)
-                file_relpath = os.path.normpath(file_relpath)
-
-                # upload file
-                self.upload_file(file_path, name=file_relpath, **kwargs)
+            name = ApiHelper.get_unix_like_path(name).rstrip("/")
+        # collect files and their names, before uploading them
+        folder_files = []
+        # get Unix-like folder relative path (renamed if folder name is specified)
+        root_relpath = name or os.path.relpath(folder, os.path.dirname(folder)).replace(
+            os.sep, "/"
+        )
+        # traverse folder tree using os.scandir(), which caches entry types
+        folders = [(folder, "" if root_relpath == "." else f"{root_relpath}/")]
+        while folders:
+            folder_path, folder_prefix = folders.pop()
+            try:
+                entries = os.scandir(folder_path)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    # do not follow symbolic links to folders
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            folders.append(
+                                (entry.path, f"{folder_prefix}{entry.name}/")
+                            )
+                    else:
+                        folder_files.append(
+                            (entry.path, f"{folder_prefix}{entry.name}")
+                        )
+
+        # upload files
+        ApiHelper.run_concurrently(
+            lambda f: self.upload_file(f[0], name=f[1], **kwargs),
+            folder_files,
+            max_workers=max_workers,
+        )
 
     # delete folder by given name
-    def delete_folder(self, folder: str, **kwargs) -> Any:
+    def delete_folder(self, folder: str, max_workers: int = 1, **kwargs) -> Any:
         """
         Delete folder
 
@@ -131,15 +189,22 @@ class FilesMixin(SupportsDataFrames, SupportsRequests):
         ----------
         folder : str
             Folder name
+        max_workers : int, default 1
+            Maximum number of files deleted concurrently. By default, files are deleted one by one.
+            If greater than 1, then files are deleted in arbitrary order, and if request fails,
+            then arbitrary subset of files might be already deleted
         """
         # get all files
         files = self.get_file_names(**kwargs)
-        # validate folder name (path is returned in Unix-like style)
+        # validate folder name (path is returned in Unix-like style),
+        # and match only files inside the folder, e.g. not 'foobar.txt' for folder 'foo'
         if folder:
-            folder = ApiHelper.get_unix_like_path(folder)
-        for filename in files:
-            if filename.startswith(folder):
-                self.delete_file(filename, **kwargs)
+            folder = ApiHelper.get_unix_like_path(folder).rstrip("/") + "/"
+        self.delete_files(
+            [filename for filename in files if filename.startswith(folder)],
+            max_workers=max_workers,
+            **kwargs,
+        )
 
     # get object by name
     def get_object(
@@ -157,25 +222,52 @@ class FilesMixin(SupportsDataFrames, SupportsRequests):
         binary : bool, default True
             Whether to use binary (True) stream io.BytesIO or text (False) stream io.StringIO
         """
-        file_obj = self.get_file(name, **kwargs)
-
         # custom binary deserialization
         if func and hasattr(func, "__call__"):
-            return func(file_obj, **kwargs)
+            return func(self.get_file(name, **kwargs), **kwargs)
         # DataFrame from csv
         if name.lower().endswith(".csv"):
-            return pd.read_csv(io.BytesIO(file_obj))
+            return pd.read_csv(io.BytesIO(self.get_file(name, **kwargs)))
         # DataFrame from excel
         if name.lower().endswith(".xlsx"):
-            return pd.read_excel(io.BytesIO(file_obj))
-        # unpickle
+            return pd.read_excel(io.BytesIO(self.get_file(name, **kwargs)))
+        # DataFrame from parquet
+        if name.lower().endswith((".parquet", ".pq")):
+            DataFrameMixinHelper.check_arrow_installed("get_object", name)
+            return pd.read_parquet(io.BytesIO(self.get_file(name, **kwargs)))
+        # DataFrame from feather
+        if name.lower().endswith(".feather"):
+            DataFrameMixinHelper.check_arrow_installed("get_object", name)
+            return pd.read_feather(io.BytesIO(self.get_file(name, **kwargs)))
+        # unpickle while downloading, without keeping whole file content in memory
         if binary:
+            file_stream = self.get_file(name, stream=True, **kwargs)
+            # return response of failed request as it is (None if errors are coerced)
+            if not isinstance(file_stream, io.IOBase):
+                return file_stream
+            try:
+                # keep stream open at the end of content, so that it can be buffered
+                file_stream.auto_close = False
+                with io.BufferedReader(file_stream) as file_obj:
+                    header = file_obj.peek(2)[:2]
+                    # gzip-compressed pickle
+                    if header == b"\x1f\x8b":
+                        return pd.read_pickle(file_obj, compression="gzip")
+                    # pickle of protocol 2 or higher
+                    if header[:1] == b"\x80":
+                        return pickle.load(file_obj)
+                    # otherwise download whole content
+                    file_content = file_obj.read()
+            finally:
+                # release connection of the stream
+                file_stream.close()
+                file_stream.release_conn()
             try:
-                return pickle.loads(file_obj)
+                return pickle.loads(file_content)
             except Exception:
-                return pd.read_pickle(io.BytesIO(file_obj), compression="gzip")
+                return pd.read_pickle(io.BytesIO(file_content), compression="gzip")
         # deserialize json
-        return json.load(io.BytesIO(file_obj), **kwargs)
+        return json.loads(self.get_file(name, **kwargs))
 
     # upload object
     def upload_object(
@@ -208,10 +300,10 @@ class FilesMixin(SupportsDataFrames, SupportsRequests):
             file = self.convert_dataframe_to_file_object(obj, name, **kwargs)
         # pickle
         elif binary:
-            file = pickle.dumps(obj)
+            file = pickle.dumps(obj, protocol=_PICKLE_PROTOCOL)
         # json
         else:
-            file = json.dumps(obj, **kwargs)
+            file = json.dumps(obj)
 
         if isinstance(file, (io.BytesIO, io.StringIO)):
             file_obj = file
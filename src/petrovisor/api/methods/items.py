@@ -7,12 +7,92 @@ from typing import (
 )
 
 import time
+from requests import Response
 
 from petrovisor.api.enums.items import ItemType
 from petrovisor.api.utils.helper import ApiHelper
 from petrovisor.api.utils.requests import ApiRequests
 from petrovisor.api.protocols.protocols import SupportsRequests
 
+# 'NamedItem' routes
+_NAMED_ITEM_ROUTES: Dict[str, str] = {
+    ItemType.Unit: "Units",
+    ItemType.UnitMeasurement: "UnitMeasurements",
+    ItemType.Entity: "Entities",
+    ItemType.EntityType: "EntityTypes",
+    ItemType.Signal: "Signals",
+    ItemType.Tag: "Tags",
+    ItemType.Label: "Labels",
+    ItemType.MessageEntry: "MessageEntries",
+    ItemType.Ticket: "Tickets",
+    ItemType.ProcessTemplate: "ProcessTemplates",
+    ItemType.UserSetting: "UserSettings",
+    ItemType.EventSubscription: "EventSubscriptions",
+}
+
+# 'InfoItem' routes
+_INFO_ITEM_ROUTES: Dict[str, str] = dict(
+    **{
+        ItemType.MLModel: "MLModels",
+        ItemType.DataGrid: "DataGrids",
+        ItemType.DataConnection: "DataConnections",
+        ItemType.DataSourceMapping: "DataSourceMappings",
+        ItemType.DataIntegrationSession: "DataIntegrationSessions",
+        ItemType.Scenario: "Scenarios",
+    },
+    **{  # alias
+        ItemType.MachineLearningModel: "MLModels",  # alias MLModel
+    },
+)
+
+# 'PetroVisorItem' routes
+_PETROVISOR_ITEM_ROUTES: Dict[str, str] = dict(
+    **{
+        ItemType.ConfigurationSettings: "ConfigurationSettings",
+        ItemType.RefTable: "RefTables",
+        ItemType.PivotTable: "PivotTables",
+        ItemType.Hierarchy: "Hierarchies",
+        ItemType.Scope: "Scopes",
+        ItemType.EntitySet: "EntitySets",
+        ItemType.Context: "Contexts",
+        ItemType.TableCalculation: "TableCalculations",
+        ItemType.EventCalculation: "EventCalculations",
+        ItemType.CleansingCalculation: "CleansingCalculations",
+        ItemType.PSharpScript: "PSharpScripts",
+        ItemType.CleansingScript: "CleansingScripts",
+        ItemType.Plot: "Plots",
+        ItemType.Chart: "Charts",
+        ItemType.Filter: "Filters",
+        ItemType.Workflow: "Workflows",
+        ItemType.WorkflowSchedule: "WorkflowSchedules",
+        ItemType.CustomWorkflowActivity: "CustomWorkflowActivities",
+        ItemType.RWorkflowActivity: "RWorkflowActivities",
+        ItemType.PythonWorkflowActivity: "PythonWorkflowActivities",
+        ItemType.WebWorkflowActivity: "WebWorkflowActivities",
+        ItemType.DataIntegrationSet: "DataIntegrationSets",
+        ItemType.WorkspacePackage: "WorkspacePackages",
+        ItemType.DCA: "DCA",
+        ItemType.PowerBIItem: "PowerBIItems",
+        ItemType.Dashboard: "Dashboards",
+    },
+    **{  # alias
+        ItemType.ConfigurationSettingValue: "ConfigurationSettings",  # alias ConfigurationSettings
+        ItemType.PivotTableDefinition: "PivotTables",  # alias PivotTable
+        ItemType.ChartDefinition: "Charts",  # alias Chart
+        ItemType.FilterDefinition: "Filters",  # alias Filter
+    },
+    **_INFO_ITEM_ROUTES,
+)
+
+# all item routes
+_ITEM_ROUTES: Dict[str, str] = dict(
+    **_NAMED_ITEM_ROUTES,
+    **_PETROVISOR_ITEM_ROUTES,
+)
+
+# routes of items, which can still exist for a while after being deleted
+_DELAYED_DELETE_ITEM_ROUTES = frozenset([_ITEM_ROUTES[ItemType.RefTable]])
+
 
 # Items API calls
 class ItemsMixin(SupportsRequests):
@@ -49,6 +129,27 @@ class ItemsMixin(SupportsRequests):
         item_name = self.get_item_name(item, **kwargs)
         return item_name in item_names
 
+    # items exist
+    def items_exist(
+        self, item_type: str, items: List[Union[str, Dict]], **kwargs
+    ) -> Dict[str, bool]:
+        """
+        Check whether items exist.
+        Item names are requested once, instead of requesting them for each item
+
+        Parameters
+        ----------
+        item_type : str
+            Item type
+        items : list[str | dict]
+            Item objects or item names
+        """
+        item_names = set(self.get_item_names(item_type, **kwargs) or [])
+        return {
+            item_name: item_name in item_names
+            for item_name in (self.get_item_name(item, **kwargs) for item in items)
+        }
+
     # get item
     def get_item(self, item_type: str, name: str, **kwargs) -> Any:
         """
@@ -70,10 +171,49 @@ class ItemsMixin(SupportsRequests):
             )
         if route == "Units" and name == " ":
             name = "_"
-        return self.get(f"{route}/{self.encode(name)}", **kwargs)
+        return self.get_shared(f"{route}/{self.encode(name)}", **kwargs)
+
+    # get items by names
+    def get_items_by_names(
+        self, item_type: str, names: List[str], max_workers: int = 16, **kwargs
+    ) -> List:
+        """
+        Get items by names.
+        All items of given type are requested at once, instead of requesting items one by one
+
+        Parameters
+        ----------
+        item_type : str
+            Item type
+        names : list[str]
+            Item names
+        max_workers : int, default 16
+            Maximum number of items, which are not found by exact name, requested concurrently
+        """
+        items = self.get_items(item_type, **kwargs) or []
+        items_by_name = {ApiHelper.get_object_name(item): item for item in items}
+        # items which are not found by exact name are requested separately
+        missing_names = list(dict.fromkeys(n for n in names if n not in items_by_name))
+        items_by_name.update(
+            zip(
+                missing_names,
+                ApiHelper.run_concurrently(
+                    lambda name: self.get_item(item_type, name, **kwargs),
+                    missing_names,
+                    max_workers=max_workers,
+                ),
+            )
+        )
+        return [items_by_name[name] for name in names]
 
     # delete item
-    def delete_item(self, item_type: str, item: Union[str, Dict], **kwargs) -> Any:
+    def delete_item(
+        self,
+        item_type: str,
+        item: Union[str, Dict],
+        max_wait: float = 60.0,
+        **kwargs,
+    ) -> Any:
         """
         Delete item
 
@@ -83,6 +223,9 @@ class ItemsMixin(SupportsRequests):
             Item type
         item : str, dict
             Item object or Item name
+        max_wait : float, default 60.0
+            Maximum time in seconds to wait for items, which are deleted with delay
+            (e.g. Reference Tables). If item still exists afterwards, then TimeoutError is raised
         """
         route = self.get_item_route(item_type, **kwargs)
         if not route:
@@ -92,11 +235,30 @@ class ItemsMixin(SupportsRequests):
                 f"Known item types: {list(self.ItemRoutes.keys())}"
             )
         name = self.get_item_name(item, **kwargs)
-        # make sure item is really deleted
-        waiting_time = 3  # in seconds
-        while self.item_exists(item_type, name):
-            self.delete(f"{route}/{self.encode(name)}", **kwargs)
-            time.sleep(waiting_time)
+        if not self.item_exists(item_type, name, **kwargs):
+            return ApiRequests.success()
+        response = self.delete(f"{route}/{self.encode(name)}", **kwargs)
+        exists = self.item_exists(item_type, name, **kwargs)
+        # return response of failed request (None if errors are coerced),
+        # if item still exists
+        if exists and (
+            response is None or (isinstance(response, Response) and not response.ok)
+        ):
+            return response
+        # make sure item is really deleted, waiting with exponential backoff
+        if exists and route in _DELAYED_DELETE_ITEM_ROUTES:
+            waiting_time = 0.1  # in seconds
+            deadline = time.monotonic() + max_wait
+            while exists:
+                remaining_time = deadline - time.monotonic()
+                if remaining_time <= 0:
+                    raise TimeoutError(
+                        f"PetroVisor::delete_item(): "
+                        f"'{name}' still exists {max_wait} seconds after being deleted."
+                    )
+                time.sleep(min(waiting_time, remaining_time))
+                waiting_time *= 2
+                exists = self.item_exists(item_type, name, **kwargs)
         return ApiRequests.success()
 
     # add or edit item
@@ -160,7 +322,7 @@ class ItemsMixin(SupportsRequests):
                 f"unknown item type: '{item_type}'. "
                 f"Known item types: {list(self.ItemRoutes.keys())}"
             )
-        return self.get(f"{route}/All", **kwargs)
+        return self.get_shared(f"{route}/All", use_etag=True, **kwargs)
 
     # get item paged
     def get_items_paged(
@@ -206,7 +368,7 @@ class ItemsMixin(SupportsRequests):
                 f"unknown item type: '{item_type}'. "
                 f"Known item types: {list(self.ItemRoutes.keys())}"
             )
-        return self.get(f"{route}", **kwargs)
+        return self.get_cached(f"{route}", use_etag=True, **kwargs)
 
     # get item labels
     def get_item_labels(
@@ -230,10 +392,15 @@ class ItemsMixin(SupportsRequests):
                 f"Known 'PetroVisor' item types: {list(self.PetroVisorItemRoutes.keys())}"
             )
         if self.is_petrovisor_item(item_type, **kwargs):
+            # request item info containing labels, instead of full item content
             if name:
-                item = self.get_item(item_type, name, **kwargs)
+                item = self.get_shared(
+                    f"{route}/{self.encode(name)}/PetroVisorItem",
+                    use_etag=True,
+                    **kwargs,
+                )
                 return item["Labels"]
-            items = self.get(f"{route}/PetroVisorItems", **kwargs)
+            items = self.get_shared(f"{route}/PetroVisorItems", use_etag=True, **kwargs)
             return [{item["Name"]: item["Labels"]} for item in items]
         return []
 
@@ -260,12 +427,18 @@ class ItemsMixin(SupportsRequests):
             )
         if self.is_info_item(item_type, **kwargs):
             if name:
-                return self.get(f"{route}/{self.encode(name)}/Info", **kwargs)
-            return self.get(f"{route}/Info", **kwargs)
+                return self.get_shared(
+                    f"{route}/{self.encode(name)}/Info", use_etag=True, **kwargs
+                )
+            return self.get_shared(f"{route}/Info", use_etag=True, **kwargs)
         elif self.is_petrovisor_item(item_type, **kwargs):
             if name:
-                return self.get(f"{route}/{self.encode(name)}/PetroVisorItem", **kwargs)
-            return self.get(f"{route}/PetroVisorItems", **kwargs)
+                return self.get_shared(
+                    f"{route}/{self.encode(name)}/PetroVisorItem",
+                    use_etag=True,
+                    **kwargs,
+                )
+            return self.get_shared(f"{route}/PetroVisorItems", use_etag=True, **kwargs)
         return {} if name else []
 
     # get item name
@@ -395,7 +568,7 @@ class ItemsMixinHelper:
         """
         Get all item types
         """
-        return list(ItemsMixinHelper.get_item_routes().keys())
+        return list(_ITEM_ROUTES.keys())
 
     # get item routes
     @staticmethod
@@ -403,10 +576,7 @@ class ItemsMixinHelper:
         """
         Get all item routes
         """
-        return dict(
-            **ItemsMixinHelper.get_named_item_routes(),
-            **ItemsMixinHelper.get_petrovisor_item_routes(),
-        )
+        return dict(_ITEM_ROUTES)
 
     # get 'NamedItem' routes
     @staticmethod
@@ -414,20 +584,7 @@ class ItemsMixinHelper:
         """
         Get routes of NamedItems
         """
-        return {
-            ItemType.Unit: "Units",
-            ItemType.UnitMeasurement: "UnitMeasurements",
-            ItemType.Entity: "Entities",
-            ItemType.EntityType: "EntityTypes",
-            ItemType.Signal: "Signals",
-            ItemType.Tag: "Tags",
-            ItemType.Label: "Labels",
-            ItemType.MessageEntry: "MessageEntries",
-            ItemType.Ticket: "Tickets",
-            ItemType.ProcessTemplate: "ProcessTemplates",
-            ItemType.UserSetting: "UserSettings",
-            ItemType.EventSubscription: "EventSubscriptions",
-        }
+        return dict(_NAMED_ITEM_ROUTES)
 
     # get 'PetroVisorItem' routes
     @staticmethod
@@ -435,19 +592,7 @@ class ItemsMixinHelper:
         """
         Get routes of InfoItems
         """
-        return dict(
-            **{
-                ItemType.MLModel: "MLModels",
-                ItemType.DataGrid: "DataGrids",
-                ItemType.DataConnection: "DataConnections",
-                ItemType.DataSourceMapping: "DataSourceMappings",
-                ItemType.DataIntegrationSession: "DataIntegrationSessions",
-                ItemType.Scenario: "Scenarios",
-            },
-            **{  # alias
-                ItemType.MachineLearningModel: "MLModels",  # alias MLModel
-            },
-        )
+        return dict(_INFO_ITEM_ROUTES)
 
     # get 'PetroVisorItem' routes
     @staticmethod
@@ -455,40 +600,4 @@ class ItemsMixinHelper:
         """
         Get routes of PetroVisorItems
         """
-        return dict(
-            **{
-                ItemType.ConfigurationSettings: "ConfigurationSettings",
-                ItemType.RefTable: "RefTables",
-                ItemType.PivotTable: "PivotTables",
-                ItemType.Hierarchy: "Hierarchies",
-                ItemType.Scope: "Scopes",
-                ItemType.EntitySet: "EntitySets",
-                ItemType.Context: "Contexts",
-                ItemType.TableCalculation: "TableCalculations",
-                ItemType.EventCalculation: "EventCalculations",
-                ItemType.CleansingCalculation: "CleansingCalculations",
-                ItemType.PSharpScript: "PSharpScripts",
-                ItemType.CleansingScript: "CleansingScripts",
-                ItemType.Plot: "Plots",
-                ItemType.Chart: "Charts",
-                ItemType.Filter: "Filters",
-                ItemType.Workflow: "Workflows",
-                ItemType.WorkflowSchedule: "WorkflowSchedules",
-                ItemType.CustomWorkflowActivity: "CustomWorkflowActivities",
-                ItemType.RWorkflowActivity: "RWorkflowActivities",
-                ItemType.PythonWorkflowActivity: "PythonWorkflowActivities",
-                ItemType.WebWorkflowActivity: "WebWorkflowActivities",
-                ItemType.DataIntegrationSet: "DataIntegrationSets",
-                ItemType.WorkspacePackage: "WorkspacePackages",
-                ItemType.DCA: "DCA",
-                ItemType.PowerBIItem: "PowerBIItems",
-                ItemType.Dashboard: "Dashboards",
-            },
-            **{  # alias
-                ItemType.ConfigurationSettingValue: "ConfigurationSettings",  # alias ConfigurationSettings
-                ItemType.PivotTableDefinition: "PivotTables",  # alias PivotTable
-                ItemType.ChartDefinition: "Charts",  # alias Chart
-                ItemType.FilterDefinition: "Filters",  # alias Filter
-            },
-            **ItemsMixinHelper.get_info_item_routes(),
-        )
+        return dict(_PETROVISOR_ITEM_ROUTES)
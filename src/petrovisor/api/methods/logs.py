@@ -1,6 +1,42 @@
+from typing import (
+    Any,
+    Union,
+    List,
+    Dict,
+)
+
 from petrovisor.api.utils.helper import ApiHelper
 from petrovisor.api.protocols.protocols import SupportsRequests
 
+# log entry fields, which can be passed as keyword arguments
+_LOG_ENTRY_FIELDS = (
+    "Timestamp",
+    "Message",
+    "Category",
+    "UserName",
+    "Severity",
+    "Workspace",
+    "Schedule",
+    "Workflow",
+    "StartTime",
+    "EndTime",
+    "Script",
+    "Entity",
+    "Signal",
+    "Unit",
+    "Tag",
+    "NumberOfItems",
+    "ValueBefore",
+    "ValueAfter",
+    "ElapsedTime",
+    "MessageDetails",
+    "Directory",
+)
+# log entry fields by their comparison strings, e.g. 'username' -> 'UserName'
+_LOG_ENTRY_FIELDS_BY_KEY = {
+    ApiHelper.get_comparison_string(field): field for field in _LOG_ENTRY_FIELDS
+}
+
 
 # PetroVisor Logs API calls
 class LogsMixin(SupportsRequests):
@@ -28,33 +64,51 @@ class LogsMixin(SupportsRequests):
             Log message
         """
         log_entry = {
-            "Timestamp": None,
             "Message": message,
             "Category": "Python Script",
-            "UserName": None,
-            "Severity": None,
             "Workspace": self.Workspace,
-            "Schedule": None,
-            "Workflow": None,
-            "StartTime": None,
-            "EndTime": None,
-            "Script": None,
-            "Entity": None,
-            "Signal": None,
-            "Unit": None,
-            "Tag": None,
-            "NumberOfItems": None,
-            "ValueBefore": None,
-            "ValueAfter": None,
-            "ElapsedTime": None,
-            "MessageDetails": None,
-            "Directory": None,
         }
-        log_entry = ApiHelper.update_dict(log_entry, **kwargs)
+        # update fields specified in keyword arguments
+        for key, value in kwargs.items():
+            if value is None:
+                continue
+            field = _LOG_ENTRY_FIELDS_BY_KEY.get(ApiHelper.get_comparison_string(key))
+            if field:
+                log_entry[field] = value
         return self.post(
             "LogEntries", data=ApiHelper.get_non_empty_fields(log_entry), **kwargs
         )
 
+    # add log entries
+    def add_log_entries(
+        self, entries: List[Union[str, Dict]], max_workers: int = 1, **kwargs
+    ) -> List[Any]:
+        """
+        Add multiple log entries.
+        Use keyword arguments to pass information shared by all entries
+
+        Parameters
+        ----------
+        entries : list[str | dict]
+            Log messages or log entries, e.g. {'Message': 'Done', 'Severity': 'Information'}
+        max_workers : int, default 1
+            Maximum number of entries added concurrently. By default, entries are added one by one
+            in the given order. If greater than 1, then entries reach the server in arbitrary order,
+            so that entries should define 'Timestamp', if their order matters
+        """
+
+        # add single log entry
+        def add_entry(entry: Union[str, Dict]) -> Any:
+            if not isinstance(entry, dict):
+                return self.add_log_entry(entry, **kwargs)
+            fields = {**kwargs, **entry}
+            message = None
+            for key in [key for key in fields if key.lower() == "message"]:
+                message = fields.pop(key)
+            return self.add_log_entry(message, **fields)
+
+        return ApiHelper.run_concurrently(add_entry, entries, max_workers=max_workers)
+
     # add workflow log entry
     def add_workflow_log_entry(self, message: str, workflow: str, **kwargs):
         """
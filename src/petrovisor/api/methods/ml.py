@@ -7,6 +7,7 @@ from typing import (
 )
 
 from uuid import UUID
+import copy
 
 from petrovisor.api.enums.items import ItemType
 from petrovisor.api.enums.ml import (
@@ -55,18 +56,24 @@ class MLMixin(SupportsPsharpRequests, SupportsItemRequests, SupportsRequests):
         return self.get_item(ItemType.MLModel, model_name, **kwargs)
 
     # get ML model attribute
-    def ml_model_attribute(self, model_name: str, attribute: str, **kwargs) -> Any:
+    def ml_model_attribute(
+        self, model_name: Union[str, Dict], attribute: str, **kwargs
+    ) -> Any:
         """
         Get ML Model type
 
         Parameters
         ----------
-        model_name : str
-            ML Model name
+        model_name : str, dict
+            ML Model name or ML Model object
         attribute : str
             ML Model attribute
         """
-        ml_model = self.ml_model(model_name, **kwargs)
+        ml_model = (
+            model_name
+            if isinstance(model_name, dict)
+            else self.ml_model(model_name, **kwargs)
+        )
         if ml_model is None or not ml_model:
             raise ValueError(
                 f"PetroVisor::ml_model_attribute(): "
@@ -80,91 +87,94 @@ class MLMixin(SupportsPsharpRequests, SupportsItemRequests, SupportsRequests):
         )
 
     # get ML model type
-    def ml_model_type(self, model_name: str, **kwargs) -> Any:
+    def ml_model_type(self, model_name: Union[str, Dict], **kwargs) -> Any:
         """
         Get ML Model type
 
         Parameters
         ----------
-        model_name : str
-            ML Model name
+        model_name : str, dict
+            ML Model name or ML Model object
         """
         return self.ml_model_attribute(model_name, "Type", **kwargs)
 
     # get ML model features and label
-    def ml_model_features_and_label(self, model_name: str, **kwargs) -> Any:
+    def ml_model_features_and_label(
+        self, model_name: Union[str, Dict], **kwargs
+    ) -> Any:
         """
         Get ML Model features and label
 
         Parameters
         ----------
-        model_name : str
-            ML Model name
+        model_name : str, dict
+            ML Model name or ML Model object
         """
-        features = {}
         features_script = self.ml_model_attribute(model_name, "TableFormula", **kwargs)
+        # only first table with columns is used
         feature_tables = self.get_psharp_script_columns_and_signals(
-            features_script, **kwargs
+            features_script, first_table=True, **kwargs
         )
-        if feature_tables:
-            for table_name, table in feature_tables.items():
-                if table:
-                    return table
-        return features
+        return next(iter(feature_tables.values()), {})
 
     # get ML model features
-    def ml_model_features(self, model_name: str, **kwargs) -> Any:
+    def ml_model_features(self, model_name: Union[str, Dict], **kwargs) -> Any:
         """
         Get ML Model features
 
         Parameters
         ----------
-        model_name : str
-            ML Model name
+        model_name : str, dict
+            ML Model name or ML Model object
         """
+        # request ML Model once for all its attributes
+        if not isinstance(model_name, dict):
+            model_name = self.ml_model(model_name, **kwargs) or model_name
         features = self.ml_model_features_and_label(model_name, **kwargs)
         label = self.ml_model_attribute(model_name, "LabelColumnName", **kwargs)
-        return {k: v for k, v in features.items() if k != label}
+        # features are parsed for each call, so that label can be removed in place
+        features.pop(label, None)
+        return features
 
     # get ML model feature names
-    def ml_model_feature_names(self, model_name: str, **kwargs) -> Any:
+    def ml_model_feature_names(self, model_name: Union[str, Dict], **kwargs) -> Any:
         """
         Get ML Model feature names
 
         Parameters
         ----------
-        model_name : str
-            ML Model name
+        model_name : str, dict
+            ML Model name or ML Model object
         """
         features = self.ml_model_features(model_name, **kwargs)
         return list(features.keys())
 
     # get ML model label
-    def ml_model_label(self, model_name: str, **kwargs) -> Any:
+    def ml_model_label(self, model_name: Union[str, Dict], **kwargs) -> Any:
         """
         Get ML Model label
 
         Parameters
         ----------
-        model_name : str
-            ML Model name
+        model_name : str, dict
+            ML Model name or ML Model object
         """
+        # request ML Model once for all its attributes
+        if not isinstance(model_name, dict):
+            model_name = self.ml_model(model_name, **kwargs) or model_name
         label = self.ml_model_attribute(model_name, "LabelColumnName", **kwargs)
         features = self.ml_model_features_and_label(model_name, **kwargs)
-        for k, v in features.items():
-            if k == label:
-                return label, v
-        return label, None
+        return label, features.get(label)
 
     # get ML model label name
-    def ml_model_label_name(self, model_name: str, **kwargs) -> Any:
+    def ml_model_label_name(self, model_name: Union[str, Dict], **kwargs) -> Any:
         """
         Get ML Model label name
 
         Parameters
         ----------
-        model_name : str
-            ML Model name
+        model_name : str, dict
+            ML Model name or ML Model object
         """
         return self.ml_model_attribute(model_name, "LabelColumnName", **kwargs)
 
@@ -184,7 +194,11 @@ class MLMixin(SupportsPsharpRequests, SupportsItemRequests, SupportsRequests):
         """
         route = "MLModels/TrainersAndMetrics"
         model_type = self.get_ml_model_type_enum(model_type, **kwargs).name
-        return self.get(route, query={"ModelType": model_type}, **kwargs)
+        # trainers and metrics depend only on model type, so that response can be reused
+        # (copied, so that cached response isn't modified by the caller)
+        return copy.deepcopy(
+            self.get_cached(route, query=f"ModelType={model_type}", **kwargs)
+        )
 
     # get ML trainers
     def ml_trainers(self, model_type: Union[str, MLModelType], **kwargs) -> Any:
@@ -204,7 +218,7 @@ class MLMixin(SupportsPsharpRequests, SupportsItemRequests, SupportsRequests):
             raise ValueError(
                 f"PetroVisor::ml_trainers(): unknown ML Model type: '{model_type}'!"
             )
-        return ml_trainers_and_metrics["Trainers"]
+        return list(ml_trainers_and_metrics["Trainers"])
 
     # get ML metrics
     def ml_metrics(self, model_type: Union[str, MLModelType], **kwargs) -> Any:
@@ -224,7 +238,7 @@ class MLMixin(SupportsPsharpRequests, SupportsItemRequests, SupportsRequests):
             raise ValueError(
                 f"PetroVisor::ml_trainers(): unknown ML Model type: '{model_type}'!"
             )
-        return ml_trainers_and_metrics["Metrics"]
+        return list(ml_trainers_and_metrics["Metrics"])
 
     # get ML pre-training statistics
     def ml_pre_training_statistics(
@@ -435,7 +449,7 @@ class MLMixin(SupportsPsharpRequests, SupportsItemRequests, SupportsRequests):
         """
         route = "ModelTraining"
         if exclude_processed:
-            self.get(f"{route}/NoProcessed", **kwargs)
+            return self.get(f"{route}/NoProcessed", **kwargs)
         return self.get(route, **kwargs)
 
     # get ML model id
@@ -455,10 +469,16 @@ class MLMixin(SupportsPsharpRequests, SupportsItemRequests, SupportsRequests):
             ml_training_states = self.ml_get_model_training_states(
                 exclude_processed=False, **kwargs
             )
-            mid = None
-            for state in ml_training_states:
-                if state["ModelName"].lower() == model_name_or_id.lower():
-                    mid = state["Id"]
+            # find latest training of ML model
+            model_name = model_name_or_id.lower()
+            mid = next(
+                (
+                    state["Id"]
+                    for state in reversed(ml_training_states or [])
+                    if state["ModelName"].lower() == model_name
+                ),
+                None,
+            )
         if mid is None:
             raise ValueError(
                 f"PetroVisor::ml_get_model_training_id(): "
@@ -44,6 +44,38 @@ class PivotTableMixin(
         """
         return self.get_item(ItemType.PivotTable, name, **kwargs)
 
+    # get pivot table options
+    def get_pivot_table_options(
+        self,
+        entity_set: Optional[Union[str, Dict]] = None,
+        scope: Optional[Union[str, Dict]] = None,
+        **kwargs,
+    ) -> Dict:
+        """
+        Get pivot table options overriding EntitySet and Scope of PivotTable definition.
+        EntitySet and Scope are requested concurrently
+
+        Parameters
+        ----------
+        entity_set : str, dict, default None
+            EntitySet object or EntitySet name
+        scope : str, dict, default None
+            Scope object or Scope name
+        """
+        overrides = [
+            (option, item_type, ApiHelper.get_object_name(item, **kwargs))
+            for option, item_type, item in (
+                ("OverrideEntitySet", ItemType.EntitySet, entity_set),
+                ("OverrideScope", ItemType.Scope, scope),
+            )
+            if item
+        ]
+        items = ApiHelper.run_concurrently(
+            lambda override: self.get_item(override[1], override[2], **kwargs),
+            overrides,
+        )
+        return {override[0]: item for override, item in zip(overrides, items)}
+
     # load pivot table data
     def load_pivot_table_data(
         self,
@@ -75,17 +107,9 @@ class PivotTableMixin(
         """
         route = "PivotTables"
         if generate or entity_set or scope:
-            options = {}
-            if entity_set:
-                entity_set_name = ApiHelper.get_object_name(entity_set, **kwargs)
-                options["OverrideEntitySet"] = self.get_item(
-                    ItemType.EntitySet, entity_set_name, **kwargs
-                )
-            if scope:
-                scope_name = ApiHelper.get_object_name(scope, **kwargs)
-                options["OverrideScope"] = self.get_item(
-                    ItemType.Scope, scope_name, **kwargs
-                )
+            options = self.get_pivot_table_options(
+                entity_set=entity_set, scope=scope, **kwargs
+            )
             if options:
                 pivot_table_data = self.get(
                     f"{route}/{self.encode(name)}/Generated/Options",
@@ -139,17 +163,9 @@ class PivotTableMixin(
             Scope object or Scope name. If None, the Scope from PivotTable definition is used.
         """
         route = "PivotTables"
-        options = {}
-        if entity_set:
-            entity_set_name = ApiHelper.get_object_name(entity_set, **kwargs)
-            options["OverrideEntitySet"] = self.get_item(
-                ItemType.EntitySet, entity_set_name, **kwargs
-            )
-        if scope:
-            scope_name = ApiHelper.get_object_name(scope, **kwargs)
-            options["OverrideScope"] = self.get_item(
-                ItemType.Scope, scope_name, **kwargs
-            )
+        options = self.get_pivot_table_options(
+            entity_set=entity_set, scope=scope, **kwargs
+        )
         if options:
             return self.post(
                 f"{route}/{self.encode(name)}/Save/Options", data=options, **kwargs
@@ -184,8 +200,8 @@ class PivotTableMixin(
         route = "PivotTables"
         if not self.item_exists(ItemType.PivotTable, name):
             return ApiRequests.success()
-        # delete data
-        self.delete_pivot_table_data(name)
+        # delete data (pivot table existence is already checked)
+        self.get(f"{route}/{self.encode(name)}/Delete", **kwargs)
         # delete item
         self.delete(f"{route}/{self.encode(name)}", **kwargs)
         return ApiRequests.success()
@@ -135,7 +135,11 @@ class PsharpMixin(
 
     # get P# script tables, columns and signals
     def get_psharp_script_columns_and_signals(
-        self, script: Union[str, Dict], options: Optional[Dict] = None, **kwargs
+        self,
+        script: Union[str, Dict],
+        options: Optional[Dict] = None,
+        first_table: bool = False,
+        **kwargs,
     ) -> Dict:
         """
         Get P# script columns and signals
@@ -146,6 +150,8 @@ class PsharpMixin(
             P# script object or P# script name
         options : dict, default None
             P# script parse options
+        first_table : bool, default False
+            Whether to get columns and signals only of the first table, which has columns
         """
         if isinstance(script, str) or "TableCalculations" not in script:
             psharp_script_parsed = self.parse_psharp_script(
@@ -159,6 +165,8 @@ class PsharpMixin(
             for t in psharp_script_parsed["TableCalculations"]:
                 table_name = t["Name"]
                 table_columns = t["Columns"]
+                if first_table and not table_columns:
+                    continue
                 table_signals[table_name] = {}
                 for col in table_columns:
                     col_name = col["Name"]
@@ -174,6 +182,8 @@ class PsharpMixin(
                         "Signal": signal_name,
                         "SignalUnit": signal_unit_name,
                     }
+                if first_table:
+                    break
         return table_signals
 
     # load P# table
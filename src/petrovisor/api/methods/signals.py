@@ -181,6 +181,7 @@ class SignalsMixin(
                 signal_type=None, entity=entity, **kwargs
             )
             if signal_names and signals:
+                signal_names = set(signal_names)
                 return [s for s in signals if s["Name"] in signal_names]
             return []
         return signals if signals is not None else []
@@ -215,6 +216,7 @@ class SignalsMixin(
                     signal_type=signal_type, entity=None, **kwargs
                 )
                 if signal_type_names:
+                    signal_type_names = set(signal_type_names)
                     return [s for s in signal_names if s in signal_type_names]
         # get signals by 'Signal' type
         elif signal_type:
@@ -6,6 +6,7 @@ from typing import (
     List,
     Set,
     Dict,
+    Iterator,
 )
 
 try:
@@ -78,6 +79,14 @@ class SupportsRequests(Protocol):
     def get(self, rqst: str, **kwargs) -> Any:
         ...
 
+    # get method sharing response with concurrent identical requests
+    def get_shared(self, rqst: str, **kwargs) -> Any:
+        ...
+
+    # get method reusing cached response
+    def get_cached(self, rqst: str, **kwargs) -> Any:
+        ...
+
     # post method
     def post(self, rqst: str, **kwargs) -> Any:
         ...
@@ -108,8 +117,20 @@ class SupportsItemRequests(Protocol):
     def get_item(self, item_type: str, name: str, **kwargs) -> Any:
         ...
 
+    # get items by names
+    def get_items_by_names(
+        self, item_type: str, names: List[str], max_workers: int = 16, **kwargs
+    ) -> List:
+        ...
+
     # delete item
-    def delete_item(self, item_type: str, item: Union[str, Dict], **kwargs) -> Any:
+    def delete_item(
+        self,
+        item_type: str,
+        item: Union[str, Dict],
+        max_wait: float = 60.0,
+        **kwargs,
+    ) -> Any:
         ...
 
     # add or edit item
@@ -184,6 +205,12 @@ class SupportsItemRequests(Protocol):
     def item_exists(self, item_type: str, item: Union[str, Dict], **kwargs) -> bool:
         ...
 
+    # items exist
+    def items_exist(
+        self, item_type: str, items: List[Union[str, Dict]], **kwargs
+    ) -> Dict[str, bool]:
+        ...
+
 
 # PetroVisor Entities requests protocol
 class SupportsEntitiesRequests(Protocol):
@@ -197,6 +224,12 @@ class SupportsEntitiesRequests(Protocol):
     ) -> List[Dict]:
         ...
 
+    # get entities by names
+    def get_entities_by_names(
+        self, names: List[str], max_requests: int = 16, **kwargs
+    ) -> List[Dict]:
+        ...
+
     # get entity names
     def get_entity_names(
         self, entity_type: Optional[str] = "", signal: Optional[str] = "", **kwargs
@@ -224,6 +257,15 @@ class SupportsSignalsRequests(Protocol):
     ) -> Optional[Dict]:
         ...
 
+    # get 'Signals'
+    def get_signals(
+        self,
+        signal_type: Union[str, SignalType] = "",
+        entity: Optional[Union[Any, str]] = None,
+        **kwargs,
+    ) -> List[Dict]:
+        ...
+
     # get 'Signal' names
     def get_signal_names(
         self,
@@ -412,7 +454,11 @@ class SupportsPsharpRequests(Protocol):
 
     # get P# script tables, columns and signals
     def get_psharp_script_columns_and_signals(
-        self, script: Union[str, Dict], options: Optional[Dict] = None, **kwargs
+        self,
+        script: Union[str, Dict],
+        options: Optional[Dict] = None,
+        first_table: bool = False,
+        **kwargs,
     ) -> Dict:
         ...
 
@@ -425,6 +471,12 @@ class SupportsDataFrames(Protocol):
     ) -> Any:
         ...
 
+    # get valid json values
+    def get_json_valid_values(
+        self, s: pd.Series, dtype: Union[str, SignalType] = "unknown", **kwargs
+    ) -> np.ndarray:
+        ...
+
     # convert dataframe to file-like object
     def convert_dataframe_to_file_object(
         self,
@@ -457,6 +509,18 @@ class SupportsDataFrames(Protocol):
     ) -> Dict[str, Any]:
         ...
 
+    # iterate over signal data from DataFrame
+    def iter_signal_data_from_dataframe(
+        self,
+        df: pd.DataFrame,
+        signals: Optional[Dict] = None,
+        only_existing_entities: bool = True,
+        entity_type: str = "",
+        entities: Optional[Dict] = None,
+        **kwargs,
+    ) -> Iterator[Tuple[str, Dict]]:
+        ...
+
     # convert P# table to DataFrame
     def convert_psharp_table_to_dataframe(
         self,
@@ -488,3 +552,12 @@ class SupportsDataFrames(Protocol):
         **kwargs,
     ) -> str:
         ...
+
+    # convert datetimes to strings
+    def datetimes_to_strings(
+        self,
+        s: pd.Series,
+        format: Optional[str] = "%Y-%m-%dT%H:%M:%S.%f",
+        **kwargs,
+    ) -> pd.Series:
+        ...
@@ -3,16 +3,90 @@ from typing import (
     Union,
     List,
     Dict,
+    Tuple,
     Optional,
+    Callable,
     cast,
 )
 
 import os
 from uuid import UUID
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 
 
+# get string preprocessed for comparison
+# (results are cached, since the same names, e.g. item types, are compared repeatedly)
+@lru_cache(maxsize=4096)
+def _get_comparison_string(
+    s: str, ignore_characters: Tuple[str, ...], ignore_case: bool, strip: bool
+) -> str:
+    for c in ignore_characters:
+        s = s.replace(c, "")
+    if ignore_case:
+        s = s.lower()
+    return s.strip() if strip else s
+
+
+# get comparison options in hashable form accepted by '_get_comparison_string'
+def _get_comparison_options(
+    ignore_characters: Union[List[str], str, bool], ignore_case: bool, strip: bool
+) -> Tuple[Tuple[str, ...], bool, bool]:
+    if not ignore_characters:
+        ignore_characters = ()
+    elif isinstance(ignore_characters, bool):
+        ignore_characters = tuple(ApiHelper.get_default_ignore_characters())
+    elif isinstance(ignore_characters, str):
+        ignore_characters = (ignore_characters,)
+    else:
+        ignore_characters = tuple(ignore_characters)
+    return ignore_characters, bool(ignore_case), bool(strip)
+
+
+# maximum number of dictionary keys, for which index of comparison strings is cached
+_COMPARISON_INDEX_MAX_KEYS = 256
+
+
+# get keys by their comparison strings, keeping first key having the same comparison string
+# (results are cached, since the same dictionaries, e.g. item routes, are searched repeatedly)
+@lru_cache(maxsize=64)
+def _get_comparison_index(
+    keys: Tuple[str, ...],
+    ignore_characters: Tuple[str, ...],
+    ignore_case: bool,
+    strip: bool,
+) -> Dict[str, str]:
+    index = {}
+    for k in keys:
+        index.setdefault(
+            _get_comparison_string(k, ignore_characters, ignore_case, strip), k
+        )
+    return index
+
+
+# object attribute names matching field names, cached by object type and field name
+_object_attribute_names: Dict[Tuple[type, str], str] = {}
+
+
+# get object attribute name matching field name (case-insensitive)
+def _get_object_attribute_name(obj: Any, field: str) -> Optional[str]:
+    key = (type(obj), field)
+    attr = _object_attribute_names.get(key)
+    if attr is not None:
+        return attr
+    if hasattr(obj, field):
+        attr = field
+    elif hasattr(obj, field.casefold()):
+        attr = field.casefold()
+    else:
+        attr = next((a for a in dir(obj) if a.casefold() == field.casefold()), None)
+    if attr is not None:
+        _object_attribute_names[key] = attr
+    return attr
+
+
 # General helper utilities
 class ApiHelper:
     """
@@ -49,6 +123,17 @@ class ApiHelper:
             return obj
         elif obj is None:
             return ""
+        # fast path for dictionaries containing field and objects having attribute
+        if isinstance(obj, dict):
+            if field in obj:
+                return obj[field] or ""
+        else:
+            attr = _get_object_attribute_name(obj, field)
+            if attr is not None:
+                try:
+                    return getattr(obj, attr) or ""
+                except Exception:
+                    pass
         try:
             return ApiHelper.get_field(obj, field, ignore_case=True) or ""
         except Exception:
@@ -216,16 +301,9 @@ class ApiHelper:
         strip : bool, default True
             Strip/Trim string
         """
-        if ignore_characters:
-            if isinstance(ignore_characters, bool):
-                ignore_characters = ApiHelper.get_default_ignore_characters()
-            elif isinstance(ignore_characters, str):
-                ignore_characters = [ignore_characters]
-            for c in ignore_characters:
-                s = s.replace(c, "")
-        if ignore_case:
-            s = s.lower()
-        return s.strip() if strip else s
+        return _get_comparison_string(
+            s, *_get_comparison_options(ignore_characters, ignore_case, strip)
+        )
 
     # get dictionary value
     @staticmethod
@@ -259,22 +337,14 @@ class ApiHelper:
             if key in d:
                 return d[key]
             else:
-                key_to_compare = ApiHelper.get_comparison_string(
-                    key,
-                    ignore_characters=ignore_characters,
-                    ignore_case=ignore_case,
-                    strip=strip,
-                    **kwargs,
-                )
+                options = _get_comparison_options(ignore_characters, ignore_case, strip)
+                key_to_compare = _get_comparison_string(key, *options)
+                # search small dictionaries (e.g. item routes) using cached index of keys
+                if len(d) <= _COMPARISON_INDEX_MAX_KEYS:
+                    k = _get_comparison_index(tuple(d), *options).get(key_to_compare)
+                    return d[k] if k is not None else None
                 for k, v in d.items():
-                    k_to_compare = ApiHelper.get_comparison_string(
-                        k,
-                        ignore_characters=ignore_characters,
-                        ignore_case=ignore_case,
-                        strip=strip,
-                        **kwargs,
-                    )
-                    if k_to_compare == key_to_compare:
+                    if _get_comparison_string(k, *options) == key_to_compare:
                         return v
         return None
 
@@ -309,22 +379,13 @@ class ApiHelper:
         if key in d:
             return True
         else:
-            key_to_compare = ApiHelper.get_comparison_string(
-                key,
-                ignore_characters=ignore_characters,
-                ignore_case=ignore_case,
-                strip=strip,
-                **kwargs,
-            )
+            options = _get_comparison_options(ignore_characters, ignore_case, strip)
+            key_to_compare = _get_comparison_string(key, *options)
+            # search small dictionaries (e.g. item routes) using cached index of keys
+            if isinstance(d, dict) and len(d) <= _COMPARISON_INDEX_MAX_KEYS:
+                return key_to_compare in _get_comparison_index(tuple(d), *options)
             for k in d:
-                k_to_compare = ApiHelper.get_comparison_string(
-                    k,
-                    ignore_characters=ignore_characters,
-                    ignore_case=ignore_case,
-                    strip=strip,
-                    **kwargs,
-                )
-                if k_to_compare == key_to_compare:
+                if _get_comparison_string(k, *options) == key_to_compare:
                     return True
         return False
 
@@ -555,3 +616,26 @@ class ApiHelper:
         if "\\" in path:
             path = path.replace("\\", "/")
         return path
+
+    # call function for each item using thread pool
+    @staticmethod
+    def run_concurrently(
+        func: Callable, items: List, max_workers: int = 16, **kwargs
+    ) -> List[Any]:
+        """
+        Call function for each item using thread pool.
+        Requests spend most of their time waiting for the server, so they can run in parallel threads
+
+        Parameters
+        ----------
+        func : Callable
+            Function to be called for each item
+        items : list
+            Items
+        max_workers : int, default 16
+            Maximum number of threads. If 1 or less, then items are processed sequentially
+        """
+        if not max_workers or max_workers <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
@@ -3,14 +3,108 @@ from typing import (
     Any,
     Optional,
     Union,
+    Tuple,
 )
 import json
+import threading
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
 from requests.utils import requote_uri
+from urllib3.util.retry import Retry
 from urllib.parse import quote
+from functools import lru_cache
+from collections import OrderedDict
 import warnings
 
+# statuses of requests retried by session: throttled (429) or failed due to unavailable server
+_RETRY_STATUSES = (429, 502, 503, 504)
+
+# statuses of 'POST' requests retried by session, which are not processed by the server.
+# Gateway errors (502, 504) might be returned after request was processed,
+# so that retrying non-idempotent 'POST' request could create duplicates
+_POST_RETRY_STATUSES = (429, 503)
+
+
+# retry policy, which retries 'POST' requests only if they were not processed by the server
+class _Retry(Retry):
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if method.upper() == "POST":
+            return status_code in _POST_RETRY_STATUSES
+        return super().is_retry(method, status_code, has_retry_after=has_retry_after)
+
+
+# responses cached by request url together with their ETag (entity tag)
+class ApiEtagCache:
+    """
+    Response contents cached by request url together with their ETag (entity tag),
+    so that unchanged responses are not downloaded again.
+    Least recently used responses are discarded, when cache is full
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        Parameters
+        ----------
+        maxsize : int, default 128
+            Maximum number of cached responses
+        """
+        self.__maxsize = maxsize
+        self.__cache: OrderedDict = OrderedDict()
+        self.__lock = threading.Lock()
+
+    # get ETag and content of cached response
+    def get(self, url: str) -> Optional[Tuple[str, bytes]]:
+        """
+        Get ETag and content of cached response
+
+        Parameters
+        ----------
+        url : str
+            Request url
+        """
+        with self.__lock:
+            cached = self.__cache.get(url)
+            if cached is not None:
+                self.__cache.move_to_end(url)
+            return cached
+
+    # cache response content together with its ETag
+    def set(self, url: str, etag: str, content: bytes) -> None:
+        """
+        Cache response content together with its ETag
+
+        Parameters
+        ----------
+        url : str
+            Request url
+        etag : str
+            Response ETag
+        content : bytes
+            Response content
+        """
+        with self.__lock:
+            self.__cache[url] = (etag, content)
+            self.__cache.move_to_end(url)
+            while len(self.__cache) > self.__maxsize:
+                self.__cache.popitem(last=False)
+
+    # clear cached responses
+    def clear(self) -> None:
+        """
+        Clear cached responses
+        """
+        with self.__lock:
+            self.__cache.clear()
+
+
+# encode url component, caching results for names requested repeatedly
+@lru_cache(maxsize=4096)
+def _quote(url_component: str, safe: Union[str, bytes]) -> str:
+    return quote(url_component, safe=safe)
+
 
 # requests functionality
 class ApiRequests:
@@ -244,6 +338,9 @@ class ApiRequests:
         format: str = "json",
         retry_on_unauthorized: bool = True,
         errors: str = "coerce",
+        stream: bool = False,
+        etag_cache: Optional[ApiEtagCache] = None,
+        session: Optional[requests.Session] = None,
         **kwargs,
     ) -> Any:
         """
@@ -277,6 +374,15 @@ class ApiRequests:
             If ‘raise’, then invalid request will raise an exception.
             If ‘coerce’, then invalid request will issue a warning and return None.
             If ‘ignore’, then invalid request will return the response.
+        stream : bool, default False
+            Whether to defer downloading response content until it is read,
+            e.g. in chunks from raw response stream with format 'raw'
+        etag_cache : ApiEtagCache, default None
+            Cache of responses by their ETag. If defined, then 'GET' response in 'json' format is cached,
+            and revalidated with conditional request, so that unchanged response (304) is not downloaded again
+        session : requests.Session, default None
+            Session used to send request, e.g. created by 'get_session'.
+            If None, then new connection is established for request
         """
         request_headers = {
             "accept": "application/json",
@@ -314,6 +420,13 @@ class ApiRequests:
         # method name
         method_name = method.upper().strip()
 
+        # conditional request, revalidating response cached by its ETag
+        if etag_cache is not None and (method_name != "GET" or format != "json"):
+            etag_cache = None
+        etag_cached = etag_cache.get(request_url) if etag_cache is not None else None
+        if etag_cached is not None:
+            request_headers["if-none-match"] = etag_cached[0]
+
         # convert data to json string
         if data and not isinstance(data, str):
             data = json.dumps(data)
@@ -325,6 +438,8 @@ class ApiRequests:
         waiting_time = 5  # in seconds
 
         # get response
+        if session is None:
+            session = requests
         response = None
         attempt = 0
         while attempt < max_retries:
@@ -334,73 +449,80 @@ class ApiRequests:
                 # The GET method requests a representation of the specified resource.
                 # Requests using GET should only retrieve data.
                 if method_name == "GET":
-                    response = requests.get(
+                    response = session.get(
                         request_url,
                         headers=request_headers,
                         data=data,
                         files=files,
                         timeout=timeout,
+                        stream=stream,
                     )
                 # POST: create resource
                 # The POST method submits an entity to the specified resource,
                 # often causing a change in state or side effects on the server.
                 elif method_name == "POST":
-                    response = requests.post(
+                    response = session.post(
                         request_url,
                         headers=request_headers,
                         data=data,
                         files=files,
                         timeout=timeout,
+                        stream=stream,
                     )
                 # PUT: update resource
                 # The PUT method replaces all current representations of the target resource with the request payload.
                 elif method_name == "PUT":
-                    response = requests.put(
+                    response = session.put(
                         request_url,
                         headers=request_headers,
                         data=data,
                         files=files,
                         timeout=timeout,
+                        stream=stream,
                     )
                 # DELETE: delete resource
                 # The DELETE method deletes the specified resource.
                 elif method_name == "DELETE":
-                    response = requests.delete(
+                    response = session.delete(
                         request_url,
                         headers=request_headers,
                         data=data,
                         files=files,
                         timeout=timeout,
+                        stream=stream,
                     )
                 # PATCH: modify resource
                 # The PATCH method applies partial modifications to a resource.
                 elif method_name == "PATCH":
-                    response = requests.patch(
+                    response = session.patch(
                         request_url,
                         headers=request_headers,
                         data=data,
                         files=files,
                         timeout=timeout,
+                        stream=stream,
                     )
                 # HEAD: read resource, response without body
                 # The HEAD method asks for a response identical to a GET request, but without the response body.
                 elif method_name == "HEAD":
-                    response = requests.head(
+                    response = session.head(
                         request_url,
                         headers=request_headers,
                         data=data,
                         files=files,
                         timeout=timeout,
+                        stream=stream,
                     )
                 # OPTIONS: specify communication options
                 # The OPTIONS method describes the communication options for the target resource.
                 elif method_name == "OPTIONS":
-                    response = requests.options(
+                    response = session.options(
                         request_url,
                         headers=request_headers,
                         data=data,
                         files=files,
                         timeout=timeout,
+                        stream=stream,
                     )
                 # CONNECT:
                 # The CONNECT method establishes a tunnel to the server identified by the target resource.
@@ -420,6 +542,8 @@ class ApiRequests:
                 ):
                     return response
 
+                # statuses retried by session ('_RETRY_STATUSES') are not retried here,
+                # so that number of retries is not multiplied
                 if response.status_code in {
                     requests.codes.bad_request,
                     requests.codes.not_found,
@@ -458,14 +582,26 @@ class ApiRequests:
             break
 
         if response is not None:
+            # cached response was not modified
+            if (
+                etag_cached is not None
+                and response.status_code == requests.codes.not_modified
+            ):
+                return json.loads(etag_cached[1])
             try:
                 if format in ("json",):
-                    return response.json()
+                    content = response.json()
+                    etag = response.headers.get("ETag")
+                    if etag_cache is not None and etag:
+                        etag_cache.set(request_url, etag, response.content)
+                    return content
                 elif format in ("bytes", "binary", "content"):
                     return response.content
                 elif format in ("text",):
                     return response.text
                 elif format in ("raw",):
+                    # decode compressed content while reading raw stream
+                    response.raw.decode_content = True
                     return response.raw
                 elif not format:
                     return response
@@ -474,6 +610,32 @@ class ApiRequests:
                 return response
         return None
 
+    # create session
+    @staticmethod
+    def get_session() -> requests.Session:
+        """
+        Create session, which is used by requests of the same api instance.
+        Session keeps connections to the server alive, so that consecutive requests
+        don't have to establish new connection (and perform TLS handshake) each time.
+        Requests throttled (429) or failed due to unavailable server (502, 503, 504)
+        are retried with exponential backoff, respecting 'Retry-After' header.
+        Non-idempotent 'POST' requests are retried only if they were not processed by the server,
+        i.e. if connection failed, or if request was throttled (429) or server is unavailable (503)
+        """
+        session = requests.Session()
+        retry = _Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     # get request url
     @staticmethod
     def get_request_url(route: str, api: str, rqst: str, **kwargs) -> str:
@@ -527,7 +689,9 @@ class ApiRequests:
         """
         if not isinstance(url_component, str):
             return url_component
-        return quote(url_component, safe=safe, **kwargs)
+        if kwargs:
+            return quote(url_component, safe=safe, **kwargs)
+        return _quote(url_component, safe)
 
     # return success response
     @staticmethod
@@ -1,6 +1,11 @@
 import os
+import json
+import threading
 import petrovisor as pv
 import pytest
+import requests
+
+from petrovisor.api.utils.requests import ApiRequests
 
 
 @pytest.fixture
@@ -10,3 +15,39 @@ def api():
         discovery_url=os.environ.get("TEST_URL"),
         key=os.environ.get("TEST_KEY"),
     )
+
+
+@pytest.fixture
+def offline_api():
+    # api session with access token, which doesn't connect to the server while created
+    return pv.PetroVisor(workspace="Test", api="http://localhost", token="token")
+
+
+# session, which returns responses of handler instead of sending requests
+class FakeSession(requests.Session):
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+        # handler(method, url, headers) -> (status code, json content, response headers)
+        self.handler = lambda method, url, headers: (200, {}, {})
+        self.lock = threading.Lock()
+
+    def request(self, method, url, headers=None, **kwargs):
+        headers = dict(headers or {})
+        with self.lock:
+            self.requests.append((method, url, headers))
+        status_code, content, response_headers = self.handler(method, url, headers)
+        response = requests.Response()
+        response.status_code = status_code
+        response.url = url
+        response.headers.update(response_headers)
+        response._content = b"" if content is None else json.dumps(content).encode()
+        return response
+
+
+@pytest.fixture
+def session(monkeypatch):
+    # session used by api sessions created afterwards
+    session = FakeSession()
+    monkeypatch.setattr(ApiRequests, "get_session", staticmethod(lambda: session))
+    return session
@@ -0,0 +1,120 @@
+import pytest
+import pandas as pd
+from petrovisor import PetroVisor
+
+
+def test_column_to_dtype(offline_api: PetroVisor):
+    df = pd.DataFrame(
+        {
+            "Time": pd.to_datetime(
+                ["2020-01-01 00:00:00", "2020-01-02 12:00:00"]
+            ).astype("datetime64[ns]"),
+            "Value": ["1", "2"],
+        }
+    )
+
+    # column which already has requested type is returned as is
+    s = offline_api.column_to_dtype(df, "Time", "time")
+    assert s.dtype == "datetime64[ns]"
+
+    # column is converted, if conversion arguments are specified
+    s = offline_api.column_to_dtype(df, "Time", "time", utc=True)
+    assert str(s.dtype).startswith("datetime64[")
+    assert str(s.dt.tz) == "UTC"
+    assert str(df["Time"].dt.tz) == "UTC"
+
+    # converted column is assigned to DataFrame
+    offline_api.column_to_dtype(df, "Value", "numeric")
+    assert pd.api.types.is_numeric_dtype(df["Value"])
+    assert df["Value"].tolist() == [1, 2]
+
+
+def test_dataframe_file_object_without_arrow(offline_api: PetroVisor, monkeypatch):
+    df = pd.DataFrame({"A": [1.0, 2.0], "B": [3.0, 4.0]})
+
+    # clear error is raised, if 'pyarrow' is not installed
+    monkeypatch.setattr("importlib.util.find_spec", lambda name, *args: None)
+    for file_name in ("test.parquet", "test.feather"):
+        with pytest.raises(ImportError, match=r"petrovisor\[arrow\]"):
+            offline_api.convert_dataframe_to_file_object(df, file_name)
+
+
+def test_datetimes_to_strings(offline_api: PetroVisor):
+    # date strings, including the ones accepted by 'pd.to_datetime' and rejected by 'strptime'
+    date_strings = [
+        "2020-01-01",
+        "2020-01-01T10:00:00",
+        "2020-01-01T10:00:00.123",
+        "2020-01-01T10:00:00.123456",
+        "2020-01-01T10:00:00.123456789",
+        "2020-01-01T10:00:00Z",
+        "2020-01-01T10:00:00.5Z",
+        "2020-01-01T10:00:00+01:00",
+        "2020-01-01 10:00:00",
+        "2020-1-1",
+        "20200101",
+        " 2020-01-01 ",
+        "2020-13-01",
+        "2020-01-01T24:00:00",
+        "not a date",
+        None,
+    ]
+    for format_str in ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%d/%m/%Y"):
+        s = pd.Series(date_strings, index=[0] * len(date_strings))
+        expected = [
+            offline_api.datetime_to_string(d, format=format_str) for d in date_strings
+        ]
+        result = offline_api.datetimes_to_strings(s, format=format_str)
+        assert result.tolist() == expected
+        assert result.index.equals(s.index)
+
+    # datetime values
+    s = pd.Series(
+        pd.to_datetime(
+            ["2020-01-01 10:00:00.123456", None, "2021-06-30 23:59:59"],
+            format="ISO8601",
+        )
+    )
+    expected = [offline_api.datetime_to_string(d) for d in s]
+    assert offline_api.datetimes_to_strings(s).tolist() == expected
+
+
+def test_assign_dataframe_column_types(offline_api: PetroVisor):
+    df = pd.DataFrame(
+        {
+            "Time": pd.to_datetime(
+                ["2020-01-01 00:00:00", "2020-01-02 12:00:00"]
+            ).astype("datetime64[ns]"),
+            "Value": ["1.5", "2"],
+        }
+    )
+    columns_dtype = {"Time": "time", "Value": "numeric"}
+
+    # column which already has requested type is kept
+    df = offline_api.assign_dataframe_column_types(df, columns_dtype)
+    assert df["Time"].dtype == "datetime64[ns]"
+    assert df["Value"].tolist() == [1.5, 2.0]
+
+    # conversion arguments are passed to conversion of column, which already has requested type
+    df = offline_api.assign_dataframe_column_types(df, columns_dtype, utc=True)
+    assert str(df["Time"].dt.tz) == "UTC"
+
+
+@pytest.mark.parametrize(
+    "values, dtype",
+    [
+        ([1.5, None, float("nan"), 3], "numeric"),
+        (["1.5", "", "  ", None, "abc"], "numeric"),
+        (["2020-01-01 12:30:00", "", None, "2020-01-02"], "time"),
+        (pd.to_datetime(["2020-01-01 12:30:00", None]), "time"),
+        (["a", None, "", float("nan")], "string"),
+        ([True, False, None], "bool"),
+        ([1, "a", None, pd.Timestamp("2020-01-01")], "unknown"),
+    ],
+)
+def test_get_json_valid_values(offline_api: PetroVisor, values, dtype):
+    s = pd.Series(values)
+    # values converted at once are the same as values converted one by one
+    expected = [offline_api.get_json_valid_value(v, dtype=dtype) for v in s]
+    result = offline_api.get_json_valid_values(s, dtype=dtype).tolist()
+    assert result == expected
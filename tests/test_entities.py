@@ -0,0 +1,31 @@
+from petrovisor import PetroVisor
+
+
+def test_get_entities_by_names(offline_api: PetroVisor, monkeypatch):
+    requests = []
+
+    def get(rqst, **kwargs):
+        requests.append(rqst)
+        if rqst == "Entities/All":
+            return [{"Name": f"Well{i}"} for i in range(100)]
+        return {"Name": rqst.split("/")[-1]}
+
+    monkeypatch.setattr(offline_api, "get", get)
+
+    # few entities are requested one by one (duplicated names are requested once)
+    names = ["Well1", "Well2", "Well1"]
+    entities = offline_api.get_entities_by_names(names)
+    assert [e["Name"] for e in entities] == names
+    assert sorted(requests) == ["Entities/Well1", "Entities/Well2"]
+
+    # many entities are requested at once, missing entities are requested separately
+    requests.clear()
+    names = [f"Well{i}" for i in range(50)] + ["Other"]
+    entities = offline_api.get_entities_by_names(names)
+    assert [e["Name"] for e in entities] == names
+    assert requests == ["Entities/All", "Entities/Other"]
+
+    # number of requests by name can be defined
+    requests.clear()
+    offline_api.get_entities_by_names(names[:3], max_requests=2)
+    assert requests == ["Entities/All"]
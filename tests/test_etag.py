@@ -0,0 +1,48 @@
+import petrovisor as pv
+from petrovisor.api.enums.items import ItemType
+from petrovisor.api.utils.requests import ApiEtagCache
+
+
+def test_etag_cache():
+    cache = ApiEtagCache(maxsize=2)
+    cache.set("a", "1", b"[]")
+    cache.set("b", "1", b"[]")
+    # recently used responses are kept, least recently used response is discarded
+    assert cache.get("a") == ("1", b"[]")
+    cache.set("c", "1", b"[]")
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_get_item_names_with_etag(session):
+    def handler(method, url, headers):
+        # unchanged response is not sent again
+        if headers.get("if-none-match") == '"v1"':
+            return 304, None, {}
+        return 200, ["Well1", "Well2"], {"ETag": '"v1"'}
+
+    session.handler = handler
+
+    # conditional requests are not sent, if 'etag_cache_size' is not defined
+    api = pv.PetroVisor(workspace="Test", api="http://localhost", token="token")
+    api.get_item_names(ItemType.Entity)
+    api.get_item_names(ItemType.Entity)
+    assert all("if-none-match" not in headers for _, _, headers in session.requests)
+
+    # cached response is returned, if it was not modified
+    session.requests.clear()
+    api = pv.PetroVisor(
+        workspace="Test", api="http://localhost", token="token", etag_cache_size=2
+    )
+    names = api.get_item_names(ItemType.Entity)
+    names.append("Other")
+    assert api.get_item_names(ItemType.Entity) == ["Well1", "Well2"]
+    assert "if-none-match" not in session.requests[0][2]
+    assert session.requests[1][2]["if-none-match"] == '"v1"'
+
+    # cached responses are discarded by 'clear_cache'
+    api.clear_cache()
+    assert api.get_item_names(ItemType.Entity) == ["Well1", "Well2"]
+    assert "if-none-match" not in session.requests[2][2]
@@ -0,0 +1,43 @@
+import time
+
+import pytest
+
+from petrovisor import PetroVisor
+from petrovisor.api.enums.items import ItemType
+from petrovisor.api.utils.requests import ApiRequests
+
+
+def test_delete_item(offline_api: PetroVisor, monkeypatch):
+    requests = []
+    # number of existence checks after which item is deleted
+    checks = {"count": 0, "deleted_after": 3}
+
+    def delete(rqst, **kwargs):
+        requests.append(rqst)
+        # entity deletion fails
+        return None if rqst.startswith("Entities/") else ApiRequests.success()
+
+    def item_exists(item_type, name, **kwargs):
+        checks["count"] += 1
+        return checks["count"] <= checks["deleted_after"]
+
+    monkeypatch.setattr(offline_api, "delete", delete)
+    monkeypatch.setattr(offline_api, "item_exists", item_exists)
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+
+    # reference table is deleted once, and existence is polled until it is deleted
+    assert offline_api.delete_item(ItemType.RefTable, "Table").ok
+    assert requests == ["RefTables/Table"]
+    assert checks["count"] == 4
+
+    # failure is raised, if reference table is not deleted in time
+    requests.clear()
+    checks.update(count=0, deleted_after=float("inf"))
+    with pytest.raises(TimeoutError):
+        offline_api.delete_item(ItemType.RefTable, "Table", max_wait=0.01)
+    assert requests == ["RefTables/Table"]
+
+    # response of failed request is returned, if other item still exists
+    requests.clear()
+    assert offline_api.delete_item(ItemType.Entity, "Well") is None
+    assert requests == ["Entities/Well"]
@@ -0,0 +1,20 @@
+import petrovisor as pv
+
+
+def test_ml_trainers_and_metrics(monkeypatch):
+    api = pv.PetroVisor(
+        workspace="Test", api="http://localhost", token="token", cache_ttl=60
+    )
+    requests = []
+
+    def get(rqst, **kwargs):
+        requests.append(rqst)
+        return {"Trainers": ["FastTree"], "Metrics": ["RSquared"]}
+
+    monkeypatch.setattr(api, "get", get)
+
+    # response is requested once, and modifying it doesn't change cached response
+    api.ml_trainers_and_metrics("Regression")["Trainers"].append("Other")
+    assert api.ml_trainers("Regression") == ["FastTree"]
+    assert api.ml_metrics("Regression") == ["RSquared"]
+    assert requests == ["MLModels/TrainersAndMetrics"]
@@ -0,0 +1,98 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+import petrovisor as pv
+
+
+def create_api(**kwargs) -> pv.PetroVisor:
+    return pv.PetroVisor(
+        workspace="Test", api="http://localhost", token="token", **kwargs
+    )
+
+
+def test_get_shared(session):
+    api = create_api()
+    started = threading.Event()
+    release = threading.Event()
+    status = {"code": 200}
+
+    def handler(method, url, headers):
+        started.set()
+        release.wait(5)
+        return status["code"], [{"Name": "Well"}], {}
+
+    session.handler = handler
+
+    # identical concurrent requests are sent once, and each caller gets own copy
+    num_callers = 8
+    with ThreadPoolExecutor(num_callers) as executor:
+        first = executor.submit(api.get_shared, "Entities")
+        started.wait(5)
+        others = [
+            executor.submit(api.get_shared, "Entities") for _ in range(num_callers - 1)
+        ]
+        # wait for requests to be issued
+        time.sleep(0.2)
+        release.set()
+        results = [first.result()] + [f.result() for f in others]
+    assert len(session.requests) == 1
+    assert all(r == [{"Name": "Well"}] for r in results)
+    assert len({id(r) for r in results}) == num_callers
+
+    # error of shared request is raised by each caller
+    session.requests.clear()
+    started.clear()
+    release.clear()
+    status["code"] = 500
+    with ThreadPoolExecutor(num_callers) as executor:
+        first = executor.submit(api.get_shared, "Entities", errors="raise")
+        started.wait(5)
+        others = [
+            executor.submit(api.get_shared, "Entities", errors="raise")
+            for _ in range(num_callers - 1)
+        ]
+        time.sleep(0.2)
+        release.set()
+        for future in [first] + others:
+            with pytest.raises(requests.exceptions.HTTPError):
+                future.result()
+    assert len(session.requests) == 1
+
+    # requests are not shared after completion
+    status["code"] = 200
+    api.get_shared("Entities")
+    assert len(session.requests) == 2
+
+
+def test_get_cached(session):
+    session.handler = lambda method, url, headers: (200, ["Well"], {})
+
+    # response is requested each time, if 'cache_ttl' is not defined
+    api = create_api()
+    api.get_cached("Entities")
+    api.get_cached("Entities")
+    assert len(session.requests) == 2
+
+    # response is reused during 'cache_ttl' seconds
+    session.requests.clear()
+    api = create_api(cache_ttl=0.2)
+    names = api.get_cached("Entities")
+    names.append("Other")
+    assert api.get_cached("Entities") == ["Well"]
+    assert len(session.requests) == 1
+
+    # response is requested again after 'cache_ttl' seconds
+    time.sleep(0.3)
+    api.get_cached("Entities")
+    assert len(session.requests) == 2
+
+    # cached responses are invalidated by modifying requests
+    for modify in (api.post, api.put, api.delete):
+        modify("Entities/Well")
+        api.get_cached("Entities")
+    methods = [method for method, url, headers in session.requests]
+    assert methods[2:] == ["POST", "GET", "PUT", "GET", "DELETE", "GET"]